@@ -5,10 +5,14 @@ Provides unified PoEntry, PoParser, escape functions, plural forms,
 and configurable branding constants used across all i18n tools.
 """
 
+import multiprocessing
 import os
+import pickle
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -18,6 +22,10 @@ from typing import Dict, List, Optional, Tuple
 PO_COPYRIGHT_HOLDER = os.environ.get("ODOO_I18N_COPYRIGHT", "ORGANIZATION")
 PO_BUGS_ADDRESS = os.environ.get("ODOO_I18N_BUGS_EMAIL", "")
 
+# Opt-in sidecar cache of parsed entries (<file>.po.cache), reused while the
+# .po file's mtime and size are unchanged.
+PO_PARSE_CACHE = os.environ.get("ODOO_I18N_PARSE_CACHE", "") not in ("", "0")
+
 
 # ---------------------------------------------------------------------------
 # Plural forms table (expanded)
@@ -97,31 +105,44 @@ DEFAULT_PLURAL_FORMS = "nplurals=2; plural=(n != 1);"
 # Escape / unescape for .po format
 # ---------------------------------------------------------------------------
 
+_ESCAPE_TABLE = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+_UNESCAPE_RE = re.compile(r'\\(["ntr\\])')
+_UNESCAPE_MAP = {'"': '"', "n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+
+
 def escape_po_string(s: str) -> str:
     """Escape special characters for .po file format."""
-    s = s.replace("\\", "\\\\")
-    s = s.replace('"', '\\"')
-    s = s.replace("\n", "\\n")
-    s = s.replace("\r", "\\r")
-    s = s.replace("\t", "\\t")
-    return s
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _unescape_char(m: "re.Match") -> str:
+    return _UNESCAPE_MAP[m.group(1)]
 
 
 def unescape_po_string(s: str) -> str:
     """Unescape a .po file string back to its original form."""
-    s = s.replace('\\"', '"')
-    s = s.replace("\\n", "\n")
-    s = s.replace("\\t", "\t")
-    s = s.replace("\\r", "\r")
-    s = s.replace("\\\\", "\\")
-    return s
+    if "\\" not in s:
+        return s
+    return _UNESCAPE_RE.sub(_unescape_char, s)
 
 
 # ---------------------------------------------------------------------------
 # PoEntry — unified data structure
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a
+# regular (dict-backed) dataclass with identical behaviour.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PoEntry:
     """A single .po file entry (msgid/msgstr pair with metadata)."""
     msgid: str = ""
@@ -158,112 +179,248 @@ class PoEntry:
 # PoParser — unified parser
 # ---------------------------------------------------------------------------
 
+# Shared stand-in for the empty per-entry lists of parsed entries
+_EMPTY: Tuple[str, ...] = ()
+
+
+def _new_entry(lineno: int) -> PoEntry:
+    """Return a parser entry starting at lineno with no comments or flags.
+
+    The per-entry lists share the _EMPTY tuple until something is added;
+    parsed entries are not mutated in place afterwards (clone_empty()
+    copies into fresh lists).
+    """
+    return PoEntry(
+        comments=_EMPTY, extracted_comments=_EMPTY, locations=_EMPTY,
+        flags=_EMPTY, line_start=lineno,
+    )
+
+
+# Bits of the per-entry status bytes in PoParser.status
+STATUS_TRANSLATED = 0x01  # non-empty msgstr
+STATUS_FUZZY = 0x02
+STATUS_OBSOLETE = 0x04
+STATUS_HEADER = 0x08
+
+
+def entry_status(entry: PoEntry) -> int:
+    """Return the STATUS_* bits describing entry."""
+    return (
+        (STATUS_TRANSLATED if entry.msgstr else 0)
+        | (STATUS_FUZZY if entry.is_fuzzy else 0)
+        | (STATUS_OBSOLETE if entry.is_obsolete else 0)
+        | (STATUS_HEADER if entry.is_header else 0)
+    )
+
+
+# One whole .po line, classified by the name of the group that matched:
+# blank lines, comments ("#," flags, "#:" locations, "#." extracted, other
+# "#") and msgid/msgstr/continuation lines holding exactly one quoted
+# string. Obsolete "#~" lines and malformed strings do not match.
+_LINE_RE = re.compile(
+    r'\s*(?:msgid \s*"(?P<msgid>.*)"|msgstr \s*"(?P<msgstr>.*)"|"(?P<cont>.*)"'
+    r'|#,(?P<flags>.*)|#:(?P<locations>.*)|#\.(?P<extracted>.*)'
+    r'|(?P<comment>#(?!~).*)|(?P<blank>))\s*\Z'
+)
+_STRING_KINDS = frozenset({"msgid", "msgstr", "cont"})
+_COMMENT_KINDS = frozenset({"flags", "locations", "extracted", "comment"})
+
+# Which string of the current entry continuation lines extend (falsy when
+# none does)
+_MODE_NONE, _MODE_MSGID, _MODE_MSGSTR = 0, 1, 2
+
+# Leading token of a stripped line that _LINE_RE rejected
+_LINE_PREFIX_RE = re.compile(r'(msgid |msgstr |"|#)')
+
+# One comma-separated flag, without surrounding whitespace (keeps flags with
+# inner spaces such as "range: 0..10" intact)
+_FLAG_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """
+    Yield the "\n"-terminated lines of content one at a time.
+
+    Used instead of content.splitlines() so that no list of every line is
+    built; like a file read with newline="", line endings are kept.
+    """
+    find = content.find
+    start = 0
+    end = find("\n")
+    while end != -1:
+        yield content[start:end + 1]
+        start = end + 1
+        end = find("\n", start)
+    if start < len(content):
+        yield content[start:]
+
+
 class PoParser:
     """
     Line-by-line .po file parser.
 
+    After parse(), ``entries`` holds the parsed entries and ``status`` is a
+    bytearray with one STATUS_* bit set per entry, in the same order.
+
     Args:
         content: The .po file text content.
+        lines_iter: Alternative to ``content`` — any iterable of lines
+                (e.g. an open text file), consumed lazily by parse().
         strict: If True, malformed strings raise ValueError and are
                 recorded in parse_errors. If False, they return empty
                 string silently. Use strict=True for validation,
                 strict=False for merge/convert/reporting.
     """
 
-    def __init__(self, content: str, strict: bool = False):
-        self.lines = content.splitlines()
+    def __init__(
+        self,
+        content: Optional[str] = None,
+        strict: bool = False,
+        lines_iter: Optional[Iterable[str]] = None,
+    ):
+        if lines_iter is None:
+            lines_iter = _iter_lines(content) if content else ()
+        self.lines = lines_iter
         self.entries: List[PoEntry] = []
+        self.status = bytearray()
         self.parse_errors: List[Tuple[int, str]] = []
         self.strict = strict
 
     def parse(self) -> List[PoEntry]:
         entries: List[PoEntry] = []
+        append_entry = entries.append
+        new_entry = _new_entry
         current: Optional[PoEntry] = None
-        mode: Optional[str] = None
-        i = 0
-
-        while i < len(self.lines):
-            lineno = i + 1
-            raw_line = self.lines[i]
-            line = raw_line.strip()
+        mode = _MODE_NONE
+        match_line = _LINE_RE.match
+        match_prefix = _LINE_PREFIX_RE.match
+        find_flags = _FLAG_RE.findall
+        parse_string = self._parse_string
+        unescape = unescape_po_string
+
+        for lineno, raw_line in enumerate(self.lines, 1):
+            # One match classifies the line and captures its payload
+            m = match_line(raw_line)
+            obsolete = False
+            if m is None:
+                line = raw_line.strip()
+                if line[:2] == "#~":
+                    # Obsolete entry ("#~ msgid ..."): flag the entry and
+                    # parse the rest of the line normally; the marker itself
+                    # is not stored
+                    obsolete = True
+                    line = line[2:].lstrip()
+                    m = match_line(line)
+
+            if m is not None:
+                kind = m.lastgroup
+                if obsolete and kind not in _STRING_KINDS:
+                    # Comments of obsolete entries — nothing to keep
+                    if current is None:
+                        current = new_entry(lineno)
+                    current.is_obsolete = True
+                    continue
+                val = m.group(kind)
+                if kind in _STRING_KINDS:
+                    val = unescape(val)
+            else:
+                # Malformed string or unknown content: _parse_string
+                # validates and records errors
+                m = match_prefix(line)
+                prefix = m.group(1) if m else None
+                if prefix == "msgid ":
+                    kind = "msgid"
+                    val = parse_string(line[6:], lineno)
+                elif prefix == "msgstr ":
+                    kind = "msgstr"
+                    val = parse_string(line[7:], lineno)
+                elif prefix == '"' and mode and current is not None:
+                    kind = "cont"
+                    val = parse_string(line, lineno)
+                elif obsolete and (prefix is None or prefix == "#"):
+                    # e.g. "#~|" previous-msgid lines — nothing to keep
+                    if current is None:
+                        current = new_entry(lineno)
+                    current.is_obsolete = True
+                    continue
+                else:
+                    kind = None
 
             # Empty line — finalize current entry
-            if not line:
+            if kind == "blank":
                 if current is not None and (current.msgid or current.is_header):
                     if not current.msgid:
                         current.is_header = True
-                    entries.append(current)
+                    append_entry(current)
                     current = None
-                    mode = None
-                i += 1
+                    mode = _MODE_NONE
                 continue
 
             # Comment / flag lines
-            if line.startswith("#"):
+            if kind in _COMMENT_KINDS:
                 if current is None:
-                    current = PoEntry(line_start=lineno)
+                    current = new_entry(lineno)
 
-                if line.startswith("#,"):
-                    flags_str = line[2:].strip()
-                    current.flags = [f.strip() for f in flags_str.split(",")]
+                # Lists start out as the shared _EMPTY tuple and are only
+                # created by the first line that adds to them
+                if kind == "flags":
+                    current.flags = find_flags(val) or _EMPTY
                     if "fuzzy" in current.flags:
                         current.is_fuzzy = True
-                elif line.startswith("#:"):
-                    locs = line[2:].strip()
-                    current.locations.extend(locs.split())
-                elif line.startswith("#."):
-                    current.extracted_comments.append(line[2:].strip())
-                elif line.startswith("#~"):
-                    current.is_obsolete = True
-                    current.comments.append(line)
+                elif kind == "locations":
+                    if current.locations:
+                        current.locations.extend(val.split())
+                    else:
+                        current.locations = val.split() or _EMPTY
+                elif kind == "extracted":
+                    if current.extracted_comments:
+                        current.extracted_comments.append(val.strip())
+                    else:
+                        current.extracted_comments = [val.strip()]
                 else:
-                    current.comments.append(line)
-                i += 1
+                    if current.comments:
+                        current.comments.append(val.rstrip())
+                    else:
+                        current.comments = [val.rstrip()]
                 continue
 
-            # msgid
-            if line.startswith("msgid "):
-                if current is not None and mode is not None:
+            if kind == "msgid":
+                if current is not None and mode:
                     # Flush previous if a new msgid starts without blank line
                     if current.msgid or current.is_header:
-                        entries.append(current)
+                        append_entry(current)
+                        current = None
                 if current is None:
-                    current = PoEntry(line_start=lineno)
-                mode = "msgid"
-                val = self._parse_string(line[6:], lineno)
+                    current = new_entry(lineno)
+                mode = _MODE_MSGID
                 if val is not None:
                     current.msgid = val
                     if val == "":
                         current.is_header = True
-                i += 1
-                continue
 
-            # msgstr
-            if line.startswith("msgstr "):
-                mode = "msgstr"
-                val = self._parse_string(line[7:], lineno)
+            elif kind == "msgstr":
+                mode = _MODE_MSGSTR
                 if val is not None and current is not None:
                     current.msgstr = val
-                i += 1
-                continue
 
-            # Continuation string (starts with ")
-            if line.startswith('"') and mode in ("msgid", "msgstr") and current is not None:
-                val = self._parse_string(line, lineno)
+            # Continuation string
+            elif kind == "cont" and mode and current is not None:
                 if val is not None:
-                    if mode == "msgid":
+                    if mode == _MODE_MSGID:
+                        # 'msgid ""' followed by continuation lines is a
+                        # multi-line msgid, not the header
                         current.msgid += val
-                        if current.msgid == "":
-                            current.is_header = True
+                        current.is_header = not current.msgid
                     else:
                         current.msgstr += val
-                i += 1
-                continue
 
             # Unknown line
-            if self.strict:
+            elif self.strict:
+                raw_line = raw_line.rstrip("\r\n")
                 self.parse_errors.append((lineno, f"Unexpected content: {raw_line!r}"))
-            i += 1
+
+            if obsolete and current is not None:
+                current.is_obsolete = True
 
         # Finalize last entry
         if current is not None and (current.msgid or current.is_header):
@@ -271,7 +428,19 @@ class PoParser:
                 current.is_header = True
             entries.append(current)
 
+        # Intern msgids/msgstrs so identical strings (across parsed files,
+        # and repeated msgstrs such as "" or "True") share one object, and
+        # msgid-keyed dict lookups short-circuit on identity. The same pass
+        # records one STATUS_* byte per entry.
+        intern = sys.intern
+        status = bytearray(len(entries))
+        for i, entry in enumerate(entries):
+            entry.msgid = intern(entry.msgid)
+            entry.msgstr = intern(entry.msgstr)
+            status[i] = entry_status(entry)
+
         self.entries = entries
+        self.status = status
         return entries
 
     def _parse_string(self, raw: str, lineno: int) -> Optional[str]:
@@ -284,3 +453,73 @@ class PoParser:
             return "" if not self.strict else None
         inner = raw[1:-1]
         return unescape_po_string(inner)
+
+
+def pool_context():
+    """Worker pool context: fork on POSIX so workers skip re-importing the scripts."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+# Read/write buffers used when streaming .po files from/to disk (1 MiB)
+PO_READ_BUFFER = 1 << 20
+PO_WRITE_BUFFER = 1 << 20
+
+
+def parse_po_file(path: Path, strict: bool = False) -> List[PoEntry]:
+    """
+    Parse a .po file straight from disk.
+
+    Lines are decoded and fed to PoParser as they are read, so the full
+    decoded text is never held in memory. A leading UTF-8 BOM is dropped.
+    When ODOO_I18N_PARSE_CACHE is set, results go through load_or_parse().
+    """
+    if PO_PARSE_CACHE:
+        return load_or_parse(path, strict=strict)
+    return read_po_file(path, strict).entries
+
+
+def read_po_file(path: Path, strict: bool = False) -> PoParser:
+    """Stream-parse a .po file and return the finished parser (entries, status)."""
+    with open(
+        path, "r", encoding="utf-8-sig", errors="replace",
+        newline="", buffering=PO_READ_BUFFER,
+    ) as fh:
+        parser = PoParser(lines_iter=fh, strict=strict)
+        parser.parse()
+    return parser
+
+
+# Bump when PoEntry or the parser output changes shape
+_PARSE_CACHE_VERSION = 4
+
+
+def load_or_parse(path: Path, strict: bool = False) -> List[PoEntry]:
+    """
+    Return parsed entries for path, using a pickled ``<file>.cache`` sidecar.
+
+    The cache is keyed on (mtime_ns, size) of the .po file and is rebuilt
+    whenever either changes. A missing, stale, or unreadable cache simply
+    falls back to parsing; failure to write the cache is ignored.
+    """
+    path = Path(path)
+    cache_path = path.with_name(path.name + ".cache")
+    st = path.stat()
+    sig = (_PARSE_CACHE_VERSION, strict, st.st_mtime_ns, st.st_size)
+
+    try:
+        with open(cache_path, "rb") as fh:
+            cached_sig, entries = pickle.load(fh)
+        if cached_sig == sig:
+            return entries
+    except Exception:
+        pass
+
+    entries = read_po_file(path, strict).entries
+    try:
+        with open(cache_path, "wb") as fh:
+            pickle.dump((sig, entries), fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return entries
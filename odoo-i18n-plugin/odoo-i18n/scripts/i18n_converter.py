@@ -18,17 +18,37 @@ Usage:
 """
 
 import argparse
+import io
+import mmap
+import os
 import re
 import shutil
 import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import compress
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
 try:
-    from ._common import PoEntry, PoParser, escape_po_string
+    from charset_normalizer import from_bytes as charset_from_bytes
+    HAS_CHARSET_NORMALIZER = True
 except ImportError:
-    from _common import PoEntry, PoParser, escape_po_string
+    HAS_CHARSET_NORMALIZER = False
+
+try:
+    from ._common import (
+        STATUS_FUZZY, STATUS_HEADER, STATUS_OBSOLETE, STATUS_TRANSLATED,
+        PO_WRITE_BUFFER, PoEntry, escape_po_string, parse_po_file, read_po_file,
+    )
+except ImportError:
+    from _common import (
+        STATUS_FUZZY, STATUS_HEADER, STATUS_OBSOLETE, STATUS_TRANSLATED,
+        PO_WRITE_BUFFER, PoEntry, escape_po_string, parse_po_file, read_po_file,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -43,71 +63,93 @@ class PoSerializer:
         return escape_po_string(s)
 
     def serialize_entry(self, entry: PoEntry, obsolete: bool = False) -> str:
-        parts = []
+        buf = io.StringIO()
+        self._write_entry(entry, buf)
+        return buf.getvalue()
+
+    def _write_entry(self, entry: PoEntry, fh: TextIO) -> None:
+        write = fh.write
 
         # Translator comments
         for c in entry.comments:
-            if not c.startswith("#~"):
-                parts.append(c)
+            write(c)
+            write("\n")
 
         # Extracted comments (from source)
         for ec in entry.extracted_comments:
-            parts.append(f"#. {ec}")
+            write(f"#. {ec}\n")
 
         # Locations
         if entry.locations:
             # Group locations, max ~76 chars per line
-            loc_line = "#:"
+            loc_parts = ["#:"]
+            loc_len = 2
             for loc in entry.locations:
-                if len(loc_line) + len(loc) + 1 > 76:
-                    parts.append(loc_line)
-                    loc_line = "#: " + loc
+                need = len(loc) + 1
+                if loc_len + need > 76 and len(loc_parts) > 1:
+                    write(" ".join(loc_parts))
+                    write("\n")
+                    loc_parts = ["#:", loc]
+                    loc_len = 2 + need
                 else:
-                    loc_line += " " + loc
-            parts.append(loc_line)
+                    loc_parts.append(loc)
+                    loc_len += need
+            write(" ".join(loc_parts))
+            write("\n")
 
         # Flags
         if entry.flags:
             flag_str = ", ".join(entry.flags)
-            parts.append(f"#, {flag_str}")
+            write(f"#, {flag_str}\n")
 
-        # msgid
-        escaped_id = self.escape(entry.msgid)
-        if "\n" in entry.msgid:
-            # Multiline
-            chunks = escaped_id.split("\\n")
-            parts.append('msgid ""')
-            for i, chunk in enumerate(chunks):
-                suffix = "\\n" if i < len(chunks) - 1 else ""
-                parts.append(f'"{chunk}{suffix}"')
-        else:
-            parts.append(f'msgid "{escaped_id}"')
+        # msgid / msgstr (commented out with "#~ " for obsolete entries)
+        prefix = "#~ " if entry.is_obsolete else ""
+        self._write_string(fh, prefix, "msgid", entry.msgid)
+        write("\n")
+        self._write_string(fh, prefix, "msgstr", entry.msgstr)
 
-        # msgstr
-        escaped_str = self.escape(entry.msgstr) if entry.msgstr else ""
-        if entry.msgstr and "\n" in entry.msgstr:
-            chunks = escaped_str.split("\\n")
-            parts.append('msgstr ""')
+    def _write_string(self, fh: TextIO, prefix: str, keyword: str, value: str) -> None:
+        escaped = self.escape(value) if value else ""
+        if "\n" in value:
+            # Multiline
+            chunks = escaped.split("\\n")
+            fh.write(f'{prefix}{keyword} ""')
+            last = len(chunks) - 1
             for i, chunk in enumerate(chunks):
-                suffix = "\\n" if i < len(chunks) - 1 else ""
-                parts.append(f'"{chunk}{suffix}"')
+                suffix = "\\n" if i < last else ""
+                fh.write(f'\n{prefix}"{chunk}{suffix}"')
         else:
-            parts.append(f'msgstr "{escaped_str}"')
+            fh.write(f'{prefix}{keyword} "{escaped}"')
 
-        return "\n".join(parts)
+    def serialize_to(self, entries: List[PoEntry], fh: TextIO) -> None:
+        """Write entries to an open text file, one block at a time."""
+        for i, entry in enumerate(entries):
+            if i:
+                fh.write("\n\n")
+            self._write_entry(entry, fh)
+        fh.write("\n")
 
     def serialize(self, entries: List[PoEntry]) -> str:
-        blocks = []
-        for entry in entries:
-            block = self.serialize_entry(entry)
-            blocks.append(block)
-        return "\n\n".join(blocks) + "\n"
+        buf = io.StringIO()
+        self.serialize_to(entries, buf)
+        return buf.getvalue()
+
+    def write_file(self, entries: List[PoEntry], output_path: Path) -> None:
+        """Serialize entries directly to output_path through a 1 MiB buffer."""
+        with open(
+            output_path, "w", encoding="utf-8", newline="\n",
+            buffering=PO_WRITE_BUFFER,
+        ) as fh:
+            self.serialize_to(entries, fh)
 
 
 # ---------------------------------------------------------------------------
 # Actions
 # ---------------------------------------------------------------------------
 
+_LANGUAGE_RE = re.compile(r'Language:\s*([^\n\\]+)')
+
+
 def action_merge(base_path: Path, new_path: Path, output_path: Path) -> int:
     """
     Merge new strings from new_path into base_path.
@@ -121,30 +163,38 @@ def action_merge(base_path: Path, new_path: Path, output_path: Path) -> int:
     print(f"  New:    {new_path}")
     print(f"  Output: {output_path}")
 
-    base_content = base_path.read_text(encoding="utf-8", errors="replace")
-    new_content = new_path.read_text(encoding="utf-8", errors="replace")
-
-    base_parser = PoParser(base_content)
-    base_entries = base_parser.parse()
-
-    new_parser = PoParser(new_content)
-    new_entries = new_parser.parse()
-
-    # Build lookup maps (by msgid)
-    base_map: Dict[str, PoEntry] = {e.msgid: e for e in base_entries if not e.is_header}
-    new_map: Dict[str, PoEntry] = {e.msgid: e for e in new_entries if not e.is_header}
+    # The two files are independent until the maps are built, so read and
+    # parse them concurrently (overlaps the file I/O).
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        base_future = pool.submit(parse_po_file, base_path)
+        new_future = pool.submit(parse_po_file, new_path)
+        base_entries = base_future.result()
+        new_entries = new_future.result()
+
+    # Build lookup maps (by msgid). Obsolete ("#~") entries of the new file
+    # are not current source strings; in base, an active entry wins over an
+    # obsolete copy of the same msgid, which is only kept as a fallback.
+    base_map: Dict[str, PoEntry] = {}
+    for e in base_entries:
+        if not e.is_header and (not e.is_obsolete or base_map.get(e.msgid, e).is_obsolete):
+            base_map[e.msgid] = e
+    new_map: Dict[str, PoEntry] = {
+        e.msgid: e for e in new_entries if not e.is_header and not e.is_obsolete
+    }
 
     # Header from base (preserved)
     header = next((e for e in base_entries if e.is_header), None)
 
-    # Update header PO-Revision-Date
+    # Update header PO-Revision-Date (msgstr is already unescaped, so the
+    # field ends at a real newline)
     if header:
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M+0000")
-        header.msgstr = re.sub(
-            r'PO-Revision-Date:[^\n]*\\n',
-            f'PO-Revision-Date: {now}\\n',
-            header.msgstr,
-        )
+        text = header.msgstr
+        start = text.find("PO-Revision-Date:")
+        if start >= 0:
+            end = text.find("\n", start)
+            tail = text[end:] if end >= 0 else ""
+            header.msgstr = f"{text[:start]}PO-Revision-Date: {now}{tail}"
 
     merged: List[PoEntry] = []
     if header:
@@ -156,10 +206,12 @@ def action_merge(base_path: Path, new_path: Path, output_path: Path) -> int:
 
     # Process all strings that appear in new .po (these are the current source strings)
     for msgid, new_entry in new_map.items():
-        if msgid in base_map:
-            base_entry = base_map[msgid]
+        base_entry = base_map.get(msgid)
+        if base_entry is not None:
             # Update locations from new (source locations may have changed)
             base_entry.locations = new_entry.locations or base_entry.locations
+            # The string is back in the source: revive an obsolete translation
+            base_entry.is_obsolete = False
             # Keep existing translation
             merged.append(base_entry)
             preserved += 1
@@ -169,20 +221,20 @@ def action_merge(base_path: Path, new_path: Path, output_path: Path) -> int:
             merged.append(new_entry_copy)
             added += 1
 
-    # Mark strings in base that are no longer in new as obsolete
-    for msgid, base_entry in base_map.items():
-        if msgid not in new_map:
-            base_entry.is_obsolete = True
-            base_entry.comments.insert(0, "#~ obsolete")
-            merged.append(base_entry)
-            marked_obsolete += 1
+    # Mark strings in base that are no longer in new as obsolete.
+    # The key-view difference runs in C and is usually empty; when it is
+    # not, base_map is walked so obsolete entries keep their file order.
+    obsolete_ids = base_map.keys() - new_map.keys()
+    if obsolete_ids:
+        for msgid, base_entry in base_map.items():
+            if msgid in obsolete_ids:
+                base_entry.is_obsolete = True
+                merged.append(base_entry)
+        marked_obsolete = len(obsolete_ids)
 
     # Serialize
-    serializer = PoSerializer()
-    output_content = serializer.serialize(merged)
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(output_content, encoding="utf-8", newline="\n")
+    PoSerializer().write_file(merged, output_path)
 
     print(f"\nMerge complete:")
     print(f"  Preserved translations: {preserved}")
@@ -192,6 +244,15 @@ def action_merge(base_path: Path, new_path: Path, output_path: Path) -> int:
     return added
 
 
+def _contains_bytes(path: Path, needle: bytes) -> bool:
+    """Check whether a file contains needle, scanning a read-only mmap."""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+
+
 def action_clean(po_path: Path, output_path: Optional[Path] = None) -> int:
     """
     Remove obsolete entries (marked with #~ or the is_obsolete flag) from a .po file.
@@ -203,9 +264,17 @@ def action_clean(po_path: Path, output_path: Optional[Path] = None) -> int:
 
     print(f"Cleaning: {po_path}")
 
-    content = po_path.read_text(encoding="utf-8", errors="replace")
-    parser = PoParser(content)
-    entries = parser.parse()
+    # Obsolete entries only come from "#~" lines: without one there is
+    # nothing to remove, so skip the parse/serialize round-trip
+    if not _contains_bytes(po_path, b"#~"):
+        if not in_place:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(po_path, output_path)
+        print("  No obsolete entries")
+        print(f"  Output: {output_path}")
+        return 0
+
+    entries = parse_po_file(po_path)
 
     original_count = len([e for e in entries if not e.is_header])
     clean_entries = [e for e in entries if not e.is_obsolete]
@@ -217,9 +286,7 @@ def action_clean(po_path: Path, output_path: Optional[Path] = None) -> int:
         shutil.copy2(po_path, backup_path)
         print(f"  Backup created: {backup_path}")
 
-    serializer = PoSerializer()
-    output_content = serializer.serialize(clean_entries)
-    output_path.write_text(output_content, encoding="utf-8", newline="\n")
+    PoSerializer().write_file(clean_entries, output_path)
 
     print(f"  Removed {removed} obsolete entries")
     print(f"  Remaining entries: {len(clean_entries) - 1}")  # -1 for header
@@ -227,21 +294,38 @@ def action_clean(po_path: Path, output_path: Optional[Path] = None) -> int:
     return removed
 
 
+# Status byte -> 1 for non-header, non-obsolete entries with a msgstr
+_ACTIVE_WITH_MSGSTR = bytes(
+    1 if bits & STATUS_TRANSLATED and not bits & (STATUS_OBSOLETE | STATUS_HEADER) else 0
+    for bits in range(256)
+)
+
+
 def action_stats(po_path: Path) -> None:
     """Print detailed statistics about a .po file."""
     print(f"Statistics for: {po_path}")
     print("")
 
-    content = po_path.read_text(encoding="utf-8", errors="replace")
-    parser = PoParser(content)
-    entries = parser.parse()
+    parser = read_po_file(po_path)
+    entries = parser.entries
 
     non_header = [e for e in entries if not e.is_header]
-    total = len(non_header)
-    translated = sum(1 for e in non_header if e.msgstr and not e.is_fuzzy and not e.is_obsolete)
-    fuzzy = sum(1 for e in non_header if e.is_fuzzy)
-    untranslated = sum(1 for e in non_header if not e.msgstr and not e.is_obsolete)
-    obsolete = sum(1 for e in non_header if e.is_obsolete)
+
+    # Classify from the parser's status bytes: one C-level tally, then a
+    # walk over at most 16 distinct status values
+    total = translated = fuzzy = untranslated = obsolete = 0
+    for bits, count in Counter(parser.status).items():
+        if bits & STATUS_HEADER:
+            continue
+        total += count
+        if bits & STATUS_FUZZY:
+            fuzzy += count
+        if bits & STATUS_OBSOLETE:
+            obsolete += count
+        elif not bits & STATUS_TRANSLATED:
+            untranslated += count
+        elif not bits & STATUS_FUZZY:
+            translated += count
     active = total - obsolete
 
     pct = (translated / active * 100) if active > 0 else 0.0
@@ -250,7 +334,7 @@ def action_stats(po_path: Path) -> None:
     header = next((e for e in entries if e.is_header), None)
     lang = "unknown"
     if header:
-        lang_match = re.search(r'Language:\s*([^\n\\]+)', header.msgstr)
+        lang_match = _LANGUAGE_RE.search(header.msgstr)
         if lang_match:
             lang = lang_match.group(1).strip()
 
@@ -278,28 +362,55 @@ def action_stats(po_path: Path) -> None:
 
     # String length distribution
     if translated > 0:
-        lengths = [len(e.msgid) for e in non_header if e.msgstr and not e.is_obsolete]
+        # Pick entries via a status-byte mask so the selection, len() calls
+        # and the packed length array are all built at C level
+        selected = compress(entries, parser.status.translate(_ACTIVE_WITH_MSGSTR))
+        lengths = array("L", map(len, map(attrgetter("msgid"), selected)))
         avg_len = sum(lengths) / len(lengths)
         max_len = max(lengths)
         print(f"  Avg msgid length:  {avg_len:.0f} chars")
         print(f"  Max msgid length:  {max_len} chars")
         print("")
 
-    # Most common locations
-    locations: Dict[str, int] = {}
-    for entry in non_header:
-        for loc in entry.locations:
-            # Extract just the file part (before :line)
-            file_part = loc.split(":")[0] if ":" in loc else loc
-            locations[file_part] = locations.get(file_part, 0) + 1
+    # Most common locations (just the file part, before :line)
+    locations = Counter(
+        loc.split(":", 1)[0] for entry in non_header for loc in entry.locations
+    )
 
     if locations:
         print("  Top source files by string count:")
-        for file_part, count in sorted(locations.items(), key=lambda x: -x[1])[:10]:
+        for file_part, count in locations.most_common(10):
             print(f"    {count:4d}  {file_part}")
         print("")
 
 
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+# Tried in order when UTF-8 fails and charset-normalizer is unavailable
+_FALLBACK_ENCODINGS = ("latin-1", "cp1256", "iso-8859-6")
+
+
+def _decode_legacy_po_bytes(raw: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Decode raw non-UTF-8 .po bytes, returning (content, encoding) or (None, None).
+
+    A single charset-normalizer probe picks the encoding, instead of fully
+    decoding the file once per candidate.
+    """
+    if HAS_CHARSET_NORMALIZER:
+        best = charset_from_bytes(raw).best()
+        if best is not None:
+            return str(best), best.encoding
+
+    for encoding in _FALLBACK_ENCODINGS:
+        try:
+            return str(raw, encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return None, None
+
+
 def action_convert(po_path: Path, output_path: Path) -> None:
     """
     Normalize a .po file:
@@ -310,56 +421,53 @@ def action_convert(po_path: Path, output_path: Path) -> None:
     """
     print(f"Converting: {po_path} -> {output_path}")
 
-    # Read raw bytes to handle encoding issues
-    raw = po_path.read_bytes()
-
-    # Strip BOM if present
-    if raw.startswith(b"\xef\xbb\xbf"):
-        raw = raw[3:]
-        print("  Removed UTF-8 BOM")
-
-    # Try decoding
-    for encoding in ("utf-8", "utf-8-sig", "latin-1", "cp1256", "iso-8859-6"):
-        try:
-            content = raw.decode(encoding)
-            if encoding != "utf-8":
-                print(f"  Re-encoded from {encoding} to UTF-8")
-            break
-        except UnicodeDecodeError:
-            continue
-    else:
+    # Decode UTF-8 (by far the common case) straight from a read-only
+    # mapping of the file, skipping any BOM, so no bytes copy of the whole
+    # file is made
+    content, encoding = None, "utf-8"
+    with open(po_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            content = ""
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                if mm[:3] == b"\xef\xbb\xbf":
+                    start = 3
+                    print("  Removed UTF-8 BOM")
+                with memoryview(mm) as full, full[start:] as raw:
+                    try:
+                        content = str(raw, "utf-8")
+                    except UnicodeDecodeError:
+                        pass
+            if content is None:
+                # Not UTF-8: charset-normalizer only takes bytes, so with the
+                # mapping closed, read the file once and probe that
+                fh.seek(start)
+                content, encoding = _decode_legacy_po_bytes(fh.read())
+    if content is None:
         print("  ERROR: Could not decode file with any known encoding", file=sys.stderr)
         sys.exit(1)
-
-    # Normalize line endings and trailing whitespace
-    lines = content.splitlines()
-    lines = [line.rstrip() for line in lines]
-
-    # Remove consecutive blank lines (max 1 blank line between entries)
-    normalized = []
-    prev_blank = False
-    for line in lines:
-        if not line.strip():
-            if not prev_blank:
-                normalized.append("")
-            prev_blank = True
-        else:
-            normalized.append(line)
-            prev_blank = False
-
-    # Ensure file ends with single newline
-    while normalized and not normalized[-1]:
-        normalized.pop()
-    normalized.append("")
-
-    output_content = "\n".join(normalized)
+    if encoding != "utf-8":
+        print(f"  Re-encoded from {encoding} to UTF-8")
+
+    # Normalize line endings
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    original_lines = content.count("\n")
+    if content and not content.endswith("\n"):
+        original_lines += 1
+
+    # Strip trailing whitespace and collapse blank-line runs (max 1 blank
+    # line between entries) on the whole text, then ensure the file ends
+    # with a single newline
+    content = _TRAILING_WS_RE.sub("", content)
+    content = _BLANK_RUN_RE.sub("\n\n", content).strip("\n")
+    output_content = content + "\n" if content else ""
 
     if output_path != po_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(output_content, encoding="utf-8", newline="\n")
 
-    original_lines = len(content.splitlines())
-    new_lines = len(normalized)
+    new_lines = output_content.count("\n") + 1
     print(f"  Original lines: {original_lines}")
     print(f"  Normalized lines: {new_lines}")
     print(f"  Output: {output_path}")
@@ -12,12 +12,17 @@ Usage:
 
 import ast
 import argparse
+import hashlib
+import io
 import os
+import pickle
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Set, TextIO, Tuple, Optional
 
 try:
     from lxml import etree
@@ -29,111 +34,141 @@ except ImportError:
 try:
     from ._common import (
         PLURAL_FORMS, DEFAULT_PLURAL_FORMS, escape_po_string,
-        PO_COPYRIGHT_HOLDER, PO_BUGS_ADDRESS,
+        PO_COPYRIGHT_HOLDER, PO_BUGS_ADDRESS, PO_PARSE_CACHE, PO_WRITE_BUFFER,
+        pool_context,
     )
 except ImportError:
     from _common import (
         PLURAL_FORMS, DEFAULT_PLURAL_FORMS, escape_po_string,
-        PO_COPYRIGHT_HOLDER, PO_BUGS_ADDRESS,
+        PO_COPYRIGHT_HOLDER, PO_BUGS_ADDRESS, PO_PARSE_CACHE, PO_WRITE_BUFFER,
+        pool_context,
     )
 
 
 # ---------------------------------------------------------------------------
-# Data structures
+# Patterns
 # ---------------------------------------------------------------------------
 
-class TranslatableString:
-    """Represents a single extracted translatable string."""
+# Python %-style placeholder -> "python-format" flag
+_PY_FORMAT_RE = re.compile(r'%[sdifr(]')
 
-    def __init__(
-        self,
-        source: str,
-        location: str,
-        line: int,
-        context: str = "",
-        flags: Optional[List[str]] = None,
-        comment: str = "",
-    ):
-        self.source = source
-        self.location = location
-        self.line = line
-        self.context = context
-        self.flags = flags or []
-        self.comment = comment
+# Translatable attributes for the stdlib (no lxml) XML fallback; matched
+# over the whole file, so values may not span lines
+_XML_ATTR_RE = re.compile(
+    r'\b(?P<attr>string|help|placeholder|confirm|summary|title|alt)\s*=\s*"(?P<value>[^"\n]+)"'
+)
+
+_NEWLINE_RE = re.compile(r"\n")
+
+# JS string-literal escapes resolved by JsExtractor (one pass per string)
+_JS_UNESCAPE_RE = re.compile(r"""\\(['"nrt\\])""")
+_JS_UNESCAPE_MAP = {"'": "'", '"': '"', "n": "\n", "r": "\r", "t": "\t", "\\": "\\"}
+
+
+# Cheap byte-level probes: files without a possible translation call are
+# never decoded or parsed
+_PY_CALL_HINT_RE = re.compile(rb"\b_(?:lt)?\s*\(")
+_JS_CALL_HINT_RE = re.compile(rb"\b_l?t\s*\(")
+
+
+def _decode_source(raw: bytes) -> str:
+    """Decode source bytes like text-mode open(): UTF-8 with replacement, universal newlines."""
+    text = raw.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _js_unescape_char(m: "re.Match") -> str:
+    return _JS_UNESCAPE_MAP[m.group(1)]
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """Sorted offsets of every newline; bisect_right(offsets, pos) + 1 is pos's line."""
+    return [m.start() for m in _NEWLINE_RE.finditer(content)]
 
-    def __repr__(self):
-        return f"<TranslatableString source={self.source!r} location={self.location}:{self.line}>"
 
-    def __eq__(self, other):
-        return self.source == other.source
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+class TranslatableString(NamedTuple):
+    """Represents a single extracted translatable string."""
 
-    def __hash__(self):
-        return hash(self.source)
+    source: str
+    location: str
+    line: int
+    context: str = ""
+    flags: Tuple[str, ...] = ()
+    comment: str = ""
 
 
 # ---------------------------------------------------------------------------
 # Python AST extractor
 # ---------------------------------------------------------------------------
 
-class PythonExtractor(ast.NodeVisitor):
+class PythonExtractor:
     """Extract _('...') and _lt('...') calls from Python source via AST."""
 
-    TRANSLATION_FUNCTIONS = {"_", "_lt"}
+    TRANSLATION_FUNCTIONS = frozenset({"_", "_lt"})
 
     def __init__(self, filepath: str, module_root: str):
         self.filepath = filepath
         self.module_root = module_root
         self.strings: List[TranslatableString] = []
-        self._relative_path = os.path.relpath(filepath, module_root)
+        self._relative_path = sys.intern(os.path.relpath(filepath, module_root))
 
     def extract(self) -> List[TranslatableString]:
         try:
-            with open(self.filepath, "r", encoding="utf-8", errors="replace") as fh:
-                source = fh.read()
+            raw = Path(self.filepath).read_bytes()
         except OSError as exc:
             print(f"  [WARN] Cannot read {self.filepath}: {exc}", file=sys.stderr)
             return []
 
+        if not _PY_CALL_HINT_RE.search(raw):
+            return self.strings
+
         try:
-            tree = ast.parse(source, filename=self.filepath)
+            tree = ast.parse(_decode_source(raw), filename=self.filepath)
         except SyntaxError as exc:
             print(f"  [WARN] SyntaxError in {self.filepath}: {exc}", file=sys.stderr)
             return []
 
-        self.visit(tree)
-        return self.strings
-
-    def visit_Call(self, node: ast.Call):
-        # Match bare _('...') or _lt('...')
-        func_name = None
-        if isinstance(node.func, ast.Name) and node.func.id in self.TRANSLATION_FUNCTIONS:
-            func_name = node.func.id
-        elif (
-            isinstance(node.func, ast.Attribute)
-            and node.func.attr in self.TRANSLATION_FUNCTIONS
-        ):
-            func_name = node.func.attr
-
-        if func_name and node.args:
+        functions = self.TRANSLATION_FUNCTIONS
+        calls = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or not node.args:
+                continue
+            # Match bare _('...') or _lt('...')
+            func = node.func
+            if isinstance(func, ast.Name):
+                if func.id not in functions:
+                    continue
+            elif not (isinstance(func, ast.Attribute) and func.attr in functions):
+                continue
             first_arg = node.args[0]
             if isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str):
-                string_value = first_arg.value
-                if string_value.strip():  # Skip empty/whitespace-only strings
-                    flags = []
-                    # Check if string contains % formatting
-                    if re.search(r'%[sdifr(]', string_value):
-                        flags.append("python-format")
-                    self.strings.append(
-                        TranslatableString(
-                            source=string_value,
-                            location=self._relative_path,
-                            line=node.lineno,
-                            flags=flags,
-                        )
+                calls.append(node)
+
+        # ast.walk is breadth-first: restore source order before emitting
+        calls.sort(key=lambda node: (node.lineno, node.col_offset))
+        for node in calls:
+            string_value = node.args[0].value
+            if string_value.strip():  # Skip empty/whitespace-only strings
+                flags = ()
+                # Check if string contains % formatting
+                if "%" in string_value and _PY_FORMAT_RE.search(string_value):
+                    flags = ("python-format",)
+                self.strings.append(
+                    TranslatableString(
+                        source=string_value,
+                        location=self._relative_path,
+                        line=node.lineno,
+                        flags=flags,
                     )
+                )
 
-        # Continue traversal
-        self.generic_visit(node)
+        return self.strings
 
 
 # ---------------------------------------------------------------------------
@@ -144,103 +179,152 @@ class XmlExtractor:
     """Extract translatable strings from Odoo XML view/data files."""
 
     # Attributes that contain translatable text
-    TRANSLATABLE_ATTRS = {
+    TRANSLATABLE_ATTRS = frozenset({
         "string", "help", "placeholder", "confirm", "summary",
         "name",  # For menu items and actions
         "title", "alt",
-    }
+    })
+    # Translatable attribute -> its interned "attr:<name>" comment; one .get()
+    # both tests membership and yields the comment
+    ATTR_COMMENTS = {attr: sys.intern(f"attr:{attr}") for attr in TRANSLATABLE_ATTRS}
 
     # Tags where 'name' attribute is NOT a translatable label
-    NAME_NOT_TRANSLATABLE_TAGS = {
+    NAME_NOT_TRANSLATABLE_TAGS = frozenset({
         "field", "record", "menuitem", "template", "t",
         "function", "delete", "odoo", "data",
-    }
+    })
 
     # Tags whose text content is translatable
-    TRANSLATABLE_TEXT_TAGS = {
+    TRANSLATABLE_TEXT_TAGS = frozenset({
         "p", "span", "h1", "h2", "h3", "h4", "h5", "h6",
         "li", "td", "th", "label", "button", "a", "div",
         "strong", "em", "small", "b", "i",
-    }
+    })
 
     def __init__(self, filepath: str, module_root: str):
         self.filepath = filepath
         self.module_root = module_root
-        self._relative_path = os.path.relpath(filepath, module_root)
+        self._relative_path = sys.intern(os.path.relpath(filepath, module_root))
         self.strings: List[TranslatableString] = []
+        # Qualified tag -> (local name, is a translatable text tag)
+        self._tags: Dict[str, Tuple[str, bool]] = {}
 
     def extract(self) -> List[TranslatableString]:
+        if HAS_LXML:
+            self._extract_lxml()
+            return self.strings
+
         try:
-            with open(self.filepath, "r", encoding="utf-8", errors="replace") as fh:
-                content = fh.read()
+            raw = Path(self.filepath).read_bytes()
         except OSError as exc:
             print(f"  [WARN] Cannot read {self.filepath}: {exc}", file=sys.stderr)
             return []
 
-        if HAS_LXML:
-            self._extract_lxml(content)
-        else:
-            self._extract_stdlib(content)
-
+        self._extract_stdlib(_decode_source(raw))
         return self.strings
 
-    def _extract_lxml(self, content: str):
+    def _extract_lxml(self):
+        """Stream the file through iterparse, releasing each subtree once seen.
+
+        Attributes are read on "start" and text on "end" (lxml only guarantees
+        ``element.text`` once the element is closed); a slot is reserved at
+        "start" so strings keep document order.
+        """
+        strings: List[Optional[TranslatableString]] = []
+        pending = {}
         try:
-            parser = etree.XMLParser(recover=True, remove_comments=True)
-            root = etree.fromstring(content.encode("utf-8"), parser)
+            # Given a path, libxml2 reads the file itself instead of
+            # pulling chunks through a Python file object
+            context = etree.iterparse(
+                self.filepath,
+                events=("start", "end"),
+                recover=True,
+                remove_comments=True,
+                huge_tree=False,
+            )
+            for event, element in context:
+                if event == "start":
+                    self._collect_attrs(element, strings, pending)
+                    continue
+
+                slot = pending.pop(element, None)
+                if slot is not None:
+                    text = (element.text or "").strip()
+                    if text and len(text) > 1:  # Skip single-char texts
+                        strings[slot] = TranslatableString(
+                            source=text,
+                            location=self._relative_path,
+                            line=getattr(element, "sourceline", 0) or 0,
+                        )
+
+                element.clear(keep_tail=False)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+        except OSError as exc:
+            print(f"  [WARN] Cannot read {self.filepath}: {exc}", file=sys.stderr)
+            return
         except Exception as exc:
             print(f"  [WARN] XML parse error in {self.filepath}: {exc}", file=sys.stderr)
             return
 
-        for element in root.iter():
-            lineno = getattr(element, "sourceline", 0) or 0
-            tag = element.tag.split("}")[-1] if "}" in str(element.tag) else str(element.tag)
-
-            # Check translatable attributes
-            for attr, value in element.attrib.items():
-                clean_attr = attr.split("}")[-1] if "}" in attr else attr
-                if clean_attr in self.TRANSLATABLE_ATTRS and value.strip():
-                    # Skip 'name' for technical tags
-                    if clean_attr == "name" and tag in self.NAME_NOT_TRANSLATABLE_TAGS:
-                        continue
-                    self.strings.append(
-                        TranslatableString(
-                            source=value.strip(),
-                            location=self._relative_path,
-                            line=lineno,
-                            comment=f"attr:{clean_attr}",
-                        )
-                    )
+        self.strings.extend(s for s in strings if s is not None)
+
+    def _collect_attrs(self, element, strings: list, pending: dict):
+        # Views repeat a handful of tags: resolve each qualified tag once
+        known = self._tags.get(element.tag)
+        if known is None:
+            tag = str(element.tag).rpartition("}")[2]
+            known = (tag, tag.lower() in self.TRANSLATABLE_TEXT_TAGS)
+            self._tags[element.tag] = known
+        tag, is_text_tag = known
+        attrib = element.attrib
+        # Most elements carry neither: reject them before any per-attribute work
+        if not attrib and not is_text_tag:
+            return
 
-            # Check text content for common HTML/QWeb tags
-            if tag.lower() in self.TRANSLATABLE_TEXT_TAGS:
-                text = (element.text or "").strip()
-                if text and len(text) > 1:  # Skip single-char texts
-                    self.strings.append(
-                        TranslatableString(
-                            source=text,
-                            location=self._relative_path,
-                            line=lineno,
-                        )
+        lineno = getattr(element, "sourceline", 0) or 0
+        attr_comments = self.ATTR_COMMENTS
+        location = self._relative_path
+
+        # Check translatable attributes
+        for attr, value in attrib.items():
+            clean_attr = attr.rpartition("}")[2] if attr[0] == "{" else attr
+            comment = attr_comments.get(clean_attr)
+            if comment is not None and value.strip():
+                # Skip 'name' for technical tags
+                if clean_attr == "name" and tag in self.NAME_NOT_TRANSLATABLE_TAGS:
+                    continue
+                strings.append(
+                    TranslatableString(
+                        source=value.strip(),
+                        location=location,
+                        line=lineno,
+                        comment=comment,
                     )
+                )
+
+        # Reserve a slot for the text of common HTML/QWeb tags
+        if is_text_tag:
+            pending[element] = len(strings)
+            strings.append(None)
 
     def _extract_stdlib(self, content: str):
         """Fallback XML extraction using stdlib (less accurate line numbers)."""
         # Attribute extraction via regex
-        attr_pattern = re.compile(
-            r'\b(?:string|help|placeholder|confirm|summary)\s*=\s*"([^"]+)"'
-        )
-        for lineno, line in enumerate(content.splitlines(), start=1):
-            for match in attr_pattern.finditer(line):
-                value = match.group(1).strip()
-                if value:
-                    self.strings.append(
-                        TranslatableString(
-                            source=value,
-                            location=self._relative_path,
-                            line=lineno,
-                        )
+        newlines = _newline_offsets(content)
+        for match in _XML_ATTR_RE.finditer(content):
+            value = match.group("value").strip()
+            if value:
+                self.strings.append(
+                    TranslatableString(
+                        source=value,
+                        location=self._relative_path,
+                        line=bisect_right(newlines, match.start()) + 1,
+                        comment=self.ATTR_COMMENTS[match.group("attr")],
                     )
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -259,42 +343,33 @@ class JsExtractor:
     def __init__(self, filepath: str, module_root: str):
         self.filepath = filepath
         self.module_root = module_root
-        self._relative_path = os.path.relpath(filepath, module_root)
+        self._relative_path = sys.intern(os.path.relpath(filepath, module_root))
         self.strings: List[TranslatableString] = []
 
     def extract(self) -> List[TranslatableString]:
         try:
-            with open(self.filepath, "r", encoding="utf-8", errors="replace") as fh:
-                content = fh.read()
+            raw = Path(self.filepath).read_bytes()
         except OSError as exc:
             print(f"  [WARN] Cannot read {self.filepath}: {exc}", file=sys.stderr)
             return []
 
-        lines = content.splitlines()
-        # Build char-to-line mapping
-        char_offsets = []
-        offset = 0
-        for lineno, line in enumerate(lines, start=1):
-            char_offsets.append((offset, lineno))
-            offset += len(line) + 1  # +1 for newline
+        if not _JS_CALL_HINT_RE.search(raw):
+            return self.strings
+
+        content = _decode_source(raw)
+        newlines = _newline_offsets(content)
 
         for match in self.PATTERN.finditer(content):
             string_value = match.group("str")
             # Unescape common sequences
-            string_value = string_value.replace("\\'", "'").replace('\\"', '"').replace("\\n", "\n")
+            if "\\" in string_value:
+                string_value = _JS_UNESCAPE_RE.sub(_js_unescape_char, string_value)
             string_value = string_value.strip()
 
             if not string_value:
                 continue
 
-            # Find line number
-            pos = match.start()
-            lineno = 1
-            for char_off, lno in char_offsets:
-                if char_off <= pos:
-                    lineno = lno
-                else:
-                    break
+            lineno = bisect_right(newlines, match.start()) + 1
 
             self.strings.append(
                 TranslatableString(
@@ -311,15 +386,46 @@ class JsExtractor:
 # Module scanner
 # ---------------------------------------------------------------------------
 
+# Modules with fewer files than this are scanned in-process: pool start-up
+# would cost more than it saves.
+PARALLEL_MIN_FILES = 16
+
+
+def _run_extractor(task: Tuple[type, str, str]) -> List[TranslatableString]:
+    """Run one extractor on one file (module-level so worker processes can pickle it)."""
+    extractor_cls, filepath, module_root = task
+    return extractor_cls(filepath, module_root).extract()
+
+
+# Opt-in (ODOO_I18N_PARSE_CACHE) per-file extraction cache, kept in the
+# output directory and reused for files whose mtime and size are unchanged.
+EXTRACT_CACHE_NAME = ".i18n_cache.pkl"
+
+# Bump when TranslatableString or the extractor output changes shape
+_EXTRACT_CACHE_VERSION = 1
+
+
+def _extract_cache_header() -> tuple:
+    """Identify the extractor build: a cache from other code or parser is discarded."""
+    with open(__file__, "rb") as fh:
+        digest = hashlib.sha1(fh.read()).hexdigest()
+    return (_EXTRACT_CACHE_VERSION, digest, HAS_LXML)
+
+
 class ModuleScanner:
     """Scan an Odoo module directory and collect all translatable strings."""
 
-    EXCLUDED_DIRS = {
+    EXCLUDED_DIRS = frozenset({
         "__pycache__", ".git", ".hg", "node_modules",
         "static/lib", "static/tests", "tests",
-    }
+    })
 
-    def __init__(self, module_path: str):
+    def __init__(
+        self,
+        module_path: str,
+        jobs: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+    ):
         self.module_path = Path(module_path).resolve()
         if not self.module_path.is_dir():
             raise ValueError(f"Module path is not a directory: {module_path}")
@@ -331,60 +437,162 @@ class ModuleScanner:
             raise ValueError(f"Not an Odoo module (no __manifest__.py): {module_path}")
 
         self.module_name = self.module_path.name
+        self.jobs = jobs or os.cpu_count() or 1
         self.strings: List[TranslatableString] = []
+        self._seen: Set[str] = set()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.cache_path = cache_path
+        self._cache_old: Dict[str, tuple] = {}
+        self._cache_new: Dict[str, tuple] = {}
 
     def scan(self) -> List[TranslatableString]:
         print(f"Scanning module: {self.module_name}")
-        self._scan_python()
-        self._scan_xml()
-        self._scan_javascript()
-        # Deduplicate by source string (keep first occurrence)
-        seen = {}
-        unique = []
-        for s in self.strings:
-            if s.source not in seen:
-                seen[s.source] = True
-                unique.append(s)
-        self.strings = unique
+        py_files, xml_files, js_files = self._walk()
+        self._load_cache()
+        try:
+            self._scan_python(py_files)
+            self._scan_xml(xml_files)
+            self._scan_javascript(js_files)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        self._save_cache()
         print(f"  Found {len(self.strings)} unique translatable strings")
         return self.strings
 
-    def _is_excluded(self, path: Path) -> bool:
-        for part in path.relative_to(self.module_path).parts:
-            if part in self.EXCLUDED_DIRS:
-                return True
-        return False
+    def _walk(self) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Collect .py, .xml and .js files in one scandir walk of the module.
+
+        Excluded directories (by name, or by module-relative path such as
+        "static/lib") are pruned and never entered. Order matches a
+        pre-order rglob: a directory's files come before its subdirectories.
+        """
+        by_ext: Dict[str, List[str]] = {".py": [], ".xml": [], ".js": []}
+        excluded = self.EXCLUDED_DIRS
+        stack = [(str(self.module_path), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                            if entry.name not in excluded and rel not in excluded:
+                                subdirs.append((entry.path, rel))
+                            continue
+                        files = by_ext.get(os.path.splitext(entry.name)[1])
+                        if files is not None:
+                            files.append(entry.path)
+            except OSError as exc:
+                print(f"  [WARN] Cannot list {dir_path}: {exc}", file=sys.stderr)
+                continue
+            stack.extend(reversed(subdirs))
+        return by_ext[".py"], by_ext[".xml"], by_ext[".js"]
+
+    def _extract_files(self, extractor_cls: type, files: List[str]) -> List[List[TranslatableString]]:
+        """
+        Run extractor_cls over files, in file order.
+
+        Files with an up-to-date cache entry are not re-read. Large sets of
+        remaining files are spread over a process pool (shared by all three
+        passes); small ones run in-process.
+        """
+        if self.cache_path is not None:
+            keys = [self._cache_key(path) for path in files]
+        else:
+            keys = [None] * len(files)
+        results = [self._cache_lookup(key) for key in keys]
+        todo = [i for i, found in enumerate(results) if found is None]
+
+        root = str(self.module_path)
+        tasks = [(extractor_cls, files[i], root) for i in todo]
+        if self.jobs <= 1 or len(tasks) < PARALLEL_MIN_FILES:
+            extracted = [_run_extractor(task) for task in tasks]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.jobs, mp_context=pool_context()
+                )
+            extracted = self._pool.map(_run_extractor, tasks, chunksize=16)
+
+        for i, found in zip(todo, extracted):
+            results[i] = found
+            if keys[i] is not None:
+                self._cache_new[keys[i][0]] = (keys[i], [tuple(s) for s in found])
+        return results
 
-    def _scan_python(self):
+    def _load_cache(self):
+        """Load the extraction cache; a missing, foreign or corrupt one is ignored."""
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "rb") as fh:
+                header, files = pickle.load(fh)
+            if header == _extract_cache_header():
+                self._cache_old = files
+        except Exception:
+            pass
+
+    def _save_cache(self):
+        """Write entries for the files seen in this scan; write errors are ignored."""
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, "wb") as fh:
+                pickle.dump(
+                    (_extract_cache_header(), self._cache_new),
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError:
+            pass
+
+    def _cache_key(self, path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.relpath(path, self.module_path), st.st_mtime_ns, st.st_size)
+
+    def _cache_lookup(self, key: Optional[tuple]) -> Optional[List[TranslatableString]]:
+        if key is None:
+            return None
+        hit = self._cache_old.get(key[0])
+        if hit is None or hit[0] != key:
+            return None
+        self._cache_new[key[0]] = hit
+        return [TranslatableString(*t) for t in hit[1]]
+
+    def _collect(self, found: List[TranslatableString]):
+        """Keep the first occurrence of each source string."""
+        seen = self._seen
+        for s in found:
+            if s.source not in seen:
+                seen.add(s.source)
+                self.strings.append(s)
+
+    def _scan_python(self, files: List[str]):
         count = 0
-        for py_file in self.module_path.rglob("*.py"):
-            if self._is_excluded(py_file):
-                continue
-            extractor = PythonExtractor(str(py_file), str(self.module_path))
-            found = extractor.extract()
-            self.strings.extend(found)
+        for found in self._extract_files(PythonExtractor, files):
+            self._collect(found)
             count += len(found)
         print(f"  Python files: {count} strings extracted")
 
-    def _scan_xml(self):
+    def _scan_xml(self, files: List[str]):
         count = 0
-        for xml_file in self.module_path.rglob("*.xml"):
-            if self._is_excluded(xml_file):
-                continue
-            extractor = XmlExtractor(str(xml_file), str(self.module_path))
-            found = extractor.extract()
-            self.strings.extend(found)
+        for found in self._extract_files(XmlExtractor, files):
+            self._collect(found)
             count += len(found)
         print(f"  XML files: {count} strings extracted")
 
-    def _scan_javascript(self):
+    def _scan_javascript(self, files: List[str]):
         count = 0
-        for js_file in self.module_path.rglob("*.js"):
-            if self._is_excluded(js_file):
-                continue
-            extractor = JsExtractor(str(js_file), str(self.module_path))
-            found = extractor.extract()
-            self.strings.extend(found)
+        for found in self._extract_files(JsExtractor, files):
+            self._collect(found)
             count += len(found)
         print(f"  JavaScript files: {count} strings extracted")
 
@@ -400,25 +608,51 @@ class PoFileGenerator:
         self.module_name = module_name
         self.strings = strings
         self.now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M+0000")
+        self.year = datetime.now().year
+        self._entries_text: Optional[str] = None
 
-    def _format_msgid(self, s: str) -> str:
-        """Format msgid with possible multiline."""
+    def _format_msgid(self, s: str, lines: List[str]):
+        """Append the msgid line(s) for s to lines, splitting multiline strings."""
         escaped = escape_po_string(s)
         if "\\n" in escaped:
             # Multiline: use empty first line, then continuation
-            lines = escaped.split("\\n")
-            result = 'msgid ""\n'
-            for i, line in enumerate(lines):
-                suffix = "\\n" if i < len(lines) - 1 else ""
-                result += f'"{line}{suffix}"\n'
-            return result
-        return f'msgid "{escaped}"\n'
-
-    def generate_pot(self) -> str:
-        """Generate the .pot template file content."""
+            chunks = escaped.split("\\n")
+            last = len(chunks) - 1
+            lines.append('msgid ""')
+            lines.extend(
+                f'"{chunk}\\n"' if i < last else f'"{chunk}"'
+                for i, chunk in enumerate(chunks)
+            )
+        else:
+            lines.append(f'msgid "{escaped}"')
+
+    def _entries(self) -> str:
+        """Entry blocks, built once and shared by the .pot and .po."""
+        if self._entries_text is None:
+            lines: List[str] = []
+            for s in self.strings:
+                if s.comment:
+                    lines.append(f"#. {s.comment}")
+                lines.append(f"#: {s.location}:{s.line}")
+                if s.flags:
+                    lines.append(f"#, {', '.join(s.flags)}")
+                self._format_msgid(s.source, lines)
+                lines.append('msgstr ""')
+                lines.append("")
+            self._entries_text = "\n".join(lines)
+        return self._entries_text
+
+    def _write(self, header: str, fh: TextIO) -> None:
+        fh.write(header)
+        entries = self._entries()
+        if entries:
+            fh.write("\n")
+            fh.write(entries)
+
+    def _pot_header(self) -> str:
         lines = [
             f"# Translation template for {self.module_name}",
-            f"# Copyright (C) {datetime.now().year} {PO_COPYRIGHT_HOLDER}",
+            f"# Copyright (C) {self.year} {PO_COPYRIGHT_HOLDER}",
             "# This file is distributed under the same license as the module.",
             "#",
             'msgid ""',
@@ -436,26 +670,15 @@ class PoFileGenerator:
             "",
         ]
 
-        for s in self.strings:
-            if s.comment:
-                lines.append(f"#. {s.comment}")
-            lines.append(f"#: {s.location}:{s.line}")
-            if s.flags:
-                lines.append(f"#, {', '.join(s.flags)}")
-            lines.append(self._format_msgid(s.source).rstrip())
-            lines.append('msgstr ""')
-            lines.append("")
-
         return "\n".join(lines)
 
-    def generate_po(self, lang: str) -> str:
-        """Generate a language-specific .po file with empty translations."""
+    def _po_header(self, lang: str) -> str:
         plural_forms = PLURAL_FORMS.get(lang, DEFAULT_PLURAL_FORMS)
         lang_display = lang.replace("_", " ")
 
         lines = [
             f"# {lang_display} translation of {self.module_name}",
-            f"# Copyright (C) {datetime.now().year} {PO_COPYRIGHT_HOLDER}",
+            f"# Copyright (C) {self.year} {PO_COPYRIGHT_HOLDER}",
             "# This file is distributed under the same license as the module.",
             "# Translator: FULL NAME <EMAIL@ADDRESS>, YEAR",
             "#",
@@ -475,19 +698,46 @@ class PoFileGenerator:
             "",
         ]
 
-        for s in self.strings:
-            if s.comment:
-                lines.append(f"#. {s.comment}")
-            lines.append(f"#: {s.location}:{s.line}")
-            if s.flags:
-                lines.append(f"#, {', '.join(s.flags)}")
-            lines.append(self._format_msgid(s.source).rstrip())
-            lines.append('msgstr ""')
-            lines.append("")
-
         return "\n".join(lines)
 
 
+    def write_pot_to(self, fh: TextIO) -> None:
+        """Write the .pot template to an open text file."""
+        self._write(self._pot_header(), fh)
+
+    def write_po_to(self, lang: str, fh: TextIO) -> None:
+        """Write a language-specific .po file with empty translations to fh."""
+        self._write(self._po_header(lang), fh)
+
+    def generate_pot(self) -> str:
+        """Generate the .pot template file content."""
+        buf = io.StringIO()
+        self.write_pot_to(buf)
+        return buf.getvalue()
+
+    def generate_po(self, lang: str) -> str:
+        """Generate a language-specific .po file with empty translations."""
+        buf = io.StringIO()
+        self.write_po_to(lang, buf)
+        return buf.getvalue()
+
+    def write_pot(self, output_path: Path) -> None:
+        """Write the .pot template to output_path through a 1 MiB buffer."""
+        with open(
+            output_path, "w", encoding="utf-8", newline="\n",
+            buffering=PO_WRITE_BUFFER,
+        ) as fh:
+            self.write_pot_to(fh)
+
+    def write_po(self, lang: str, output_path: Path) -> None:
+        """Write the .po file for lang to output_path through a 1 MiB buffer."""
+        with open(
+            output_path, "w", encoding="utf-8", newline="\n",
+            buffering=PO_WRITE_BUFFER,
+        ) as fh:
+            self.write_po_to(lang, fh)
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -526,6 +776,14 @@ Examples:
         action="store_true",
         help="Skip generating .pot template file",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for file extraction (default: CPU count, 1 = no pool)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -544,9 +802,16 @@ def main():
         print(f"ERROR: Module path does not exist or is not a directory: {args.module}", file=sys.stderr)
         sys.exit(1)
 
+    # Determine output directory
+    if args.output:
+        output_dir = Path(args.output).resolve()
+    else:
+        output_dir = module_path / "i18n"
+
     # Scan module
+    cache_path = output_dir / EXTRACT_CACHE_NAME if PO_PARSE_CACHE else None
     try:
-        scanner = ModuleScanner(str(module_path))
+        scanner = ModuleScanner(str(module_path), jobs=args.jobs, cache_path=cache_path)
         strings = scanner.scan()
     except ValueError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
@@ -561,12 +826,6 @@ def main():
         for s in strings:
             print(f"  [{s.location}:{s.line}] {s.source!r}")
 
-    # Determine output directory
-    if args.output:
-        output_dir = Path(args.output).resolve()
-    else:
-        output_dir = module_path / "i18n"
-
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nOutput directory: {output_dir}")
 
@@ -576,9 +835,7 @@ def main():
     # Generate .pot template
     if not args.no_pot:
         pot_path = output_dir / f"{scanner.module_name}.pot"
-        pot_content = generator.generate_pot()
-        with open(pot_path, "w", encoding="utf-8", newline="\n") as fh:
-            fh.write(pot_content)
+        generator.write_pot(pot_path)
         print(f"  Generated: {pot_path}")
 
     # Generate .po file for target language
@@ -592,9 +849,7 @@ def main():
         shutil.copy2(po_path, backup_path)
         print(f"  Existing {po_filename} backed up to {backup_path.name}")
 
-    po_content = generator.generate_po(args.lang)
-    with open(po_path, "w", encoding="utf-8", newline="\n") as fh:
-        fh.write(po_content)
+    generator.write_po(args.lang, po_path)
     print(f"  Generated: {po_path}")
 
     print(f"\nExtraction complete!")
@@ -10,22 +10,33 @@ Usage:
     python i18n_reporter.py --module /path/to/my_module --lang ar
     python i18n_reporter.py --module /path/to/my_module --lang ar --format json
     python i18n_reporter.py --module /path/to/my_module --lang ar --missing-only
+    python i18n_reporter.py --module /path/to/my_module --lang ar --cache-dir .i18n-cache
 """
 
 import argparse
+import csv
+import hashlib
+import io
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, TextIO, Tuple
 
 try:
-    from ._common import PoParser
+    from ._common import (
+        PO_PARSE_CACHE, STATUS_FUZZY, STATUS_HEADER, STATUS_OBSOLETE, read_po_file,
+    )
     from .i18n_extractor import ModuleScanner, TranslatableString
 except ImportError:
-    from _common import PoParser
+    from _common import (
+        PO_PARSE_CACHE, STATUS_FUZZY, STATUS_HEADER, STATUS_OBSOLETE, read_po_file,
+    )
     from i18n_extractor import ModuleScanner, TranslatableString
 
 
@@ -33,38 +44,47 @@ except ImportError:
 # .po reader (uses shared PoParser)
 # ---------------------------------------------------------------------------
 
-def read_po_translations(po_path: Path) -> Dict[str, str]:
+_SKIPPED = STATUS_FUZZY | STATUS_OBSOLETE | STATUS_HEADER
+
+
+def read_po_translations(po_path: Path) -> Tuple[Dict[str, str], int]:
     """
-    Read a .po file and return a dict of {msgid: msgstr}.
-    Fuzzy and header entries are excluded.
+    Stream-parse a .po file once and return ({msgid: msgstr}, fuzzy_count).
+
+    Fuzzy, obsolete and header entries are excluded from the dict;
+    fuzzy_count counts the active (non-obsolete) fuzzy entries.
     """
     if not po_path.exists():
-        return {}
-
-    content = po_path.read_text(encoding="utf-8", errors="replace")
-    parser = PoParser(content, strict=False)
-    entries = parser.parse()
+        return {}, 0
 
-    return {
+    parser = read_po_file(po_path)
+    status = parser.status
+    translations = {
         e.msgid: e.msgstr
-        for e in entries
-        if not e.is_header and not e.is_fuzzy
+        for e, st in zip(parser.entries, status)
+        if not st & _SKIPPED
     }
+    fuzzy_count = sum(1 for st in status if st & _SKIPPED == STATUS_FUZZY)
+    return translations, fuzzy_count
 
 
 # ---------------------------------------------------------------------------
 # Report data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
-class MissingEntry:
+class MissingEntry(NamedTuple):
     msgid: str
     location: str
     line: int
     source_file_type: str  # 'python', 'xml', 'javascript'
 
     def to_dict(self):
-        return asdict(self)
+        return self._asdict()
+
+
+# MissingEntry sort key: (location, line); _LOCATION groups the sorted list
+_BY_LOCATION = itemgetter(1, 2)
+_LOCATION = itemgetter(1)
 
 
 @dataclass
@@ -83,6 +103,8 @@ class TranslationReport:
     completion_pct: float
 
     missing_entries: List[MissingEntry] = field(default_factory=list)
+    # source_file_type -> number of missing entries, tallied by run()
+    missing_by_type: Dict[str, int] = field(default_factory=dict)
 
     def to_dict(self):
         d = {
@@ -104,6 +126,79 @@ class TranslationReport:
         return d
 
 
+# ---------------------------------------------------------------------------
+# Report cache
+# ---------------------------------------------------------------------------
+
+# Bump when TranslationReport or the cached payload changes shape
+_REPORT_CACHE_VERSION = 1
+
+# Scripts whose behaviour determines the report; editing any of them
+# invalidates every cached report
+_REPORT_CODE_FILES = ("_common.py", "i18n_extractor.py", "i18n_reporter.py")
+
+
+def default_report_cache_dir() -> Path:
+    """$XDG_CACHE_HOME/odoo-i18n, falling back to ~/.cache/odoo-i18n."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "odoo-i18n"
+
+
+def _code_digest() -> str:
+    h = hashlib.blake2b(digest_size=16)
+    here = Path(__file__).resolve().parent
+    for name in _REPORT_CODE_FILES:
+        try:
+            h.update((here / name).read_bytes())
+        except OSError:
+            h.update(name.encode())
+    return h.hexdigest()
+
+
+def _tree_mtime_ns(root: Path) -> int:
+    """
+    Newest st_mtime_ns of root and everything below it.
+
+    Directory mtimes are included so that added, removed or renamed files
+    change the result too; ModuleScanner.EXCLUDED_DIRS are skipped.
+    """
+    excluded = ModuleScanner.EXCLUDED_DIRS
+    newest = root.stat().st_mtime_ns
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir and entry.name in excluded:
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                except OSError:
+                    continue
+                if mtime > newest:
+                    newest = mtime
+                if is_dir:
+                    stack.append(entry.path)
+    return newest
+
+
+def _report_to_cache(report: TranslationReport) -> dict:
+    # Unlike to_dict(), keeps completion_pct unrounded for --min-pct
+    d = {f.name: getattr(report, f.name) for f in fields(report)}
+    d["missing_entries"] = [list(e) for e in report.missing_entries]
+    return d
+
+
+def _report_from_cache(d: dict) -> TranslationReport:
+    d = dict(d)
+    d["missing_entries"] = [MissingEntry(*e) for e in d["missing_entries"]]
+    return TranslationReport(**d)
+
+
 # ---------------------------------------------------------------------------
 # Reporter
 # ---------------------------------------------------------------------------
@@ -122,6 +217,14 @@ class TranslationReporter:
         self.lang = lang
         self.module_name = self.module_path.name
 
+    def _file_type(self, location: str) -> str:
+        """Map a source location to 'python', 'xml', 'javascript' or 'other'."""
+        location = location.lower()
+        for ext, file_type in self.EXTENSION_TYPE.items():
+            if location.endswith(ext):
+                return file_type
+        return "other"
+
     def run(self) -> TranslationReport:
         """Scan module, read .po file, and build the TranslationReport."""
         # Step 1: Extract source strings
@@ -135,55 +238,44 @@ class TranslationReporter:
 
         if not po_exists:
             print(f"  WARNING: .po file not found: {po_path}")
-            translations = {}
+            translations, fuzzy_count = {}, 0
         else:
-            translations = read_po_translations(po_path)
+            translations, fuzzy_count = read_po_translations(po_path)
             print(f"  Found {len(translations)} entries in {po_path.name}")
 
         # Step 3: Compare
         missing_entries: List[MissingEntry] = []
         translated_count = 0
         empty_in_po = 0
+        # Many strings share a file: resolve each location's type once
+        type_by_location: Dict[str, str] = {}
+        missing_by_type: Counter = Counter()
+        lookup = translations.get
+        add_missing = missing_entries.append
 
         for s in source_strings:
-            # Determine file type from location
-            ext = Path(s.location).suffix.lower()
-            file_type = self.EXTENSION_TYPE.get(ext, "other")
-
-            if s.source in translations:
-                val = translations[s.source]
+            val = lookup(s.source)  # msgstr values are never None
+            if val is not None:
                 if val:  # Non-empty translation
                     translated_count += 1
-                else:
-                    empty_in_po += 1
-                    missing_entries.append(
-                        MissingEntry(
-                            msgid=s.source,
-                            location=s.location,
-                            line=s.line,
-                            source_file_type=file_type,
-                        )
-                    )
-            else:
-                # Not in .po at all
-                missing_entries.append(
-                    MissingEntry(
-                        msgid=s.source,
-                        location=s.location,
-                        line=s.line,
-                        source_file_type=file_type,
-                    )
-                )
+                    continue
+                empty_in_po += 1
+            # Missing: not in .po at all, or present with an empty msgstr
+
+            # Determine file type from location
+            file_type = type_by_location.get(s.location)
+            if file_type is None:
+                file_type = self._file_type(s.location)
+                type_by_location[s.location] = file_type
+            missing_by_type[file_type] += 1
+            add_missing(MissingEntry(s.source, s.location, s.line, file_type))
 
         total = len(source_strings)
         missing_count = len(missing_entries)
         completion_pct = (translated_count / total * 100) if total > 0 else 0.0
 
-        # Count fuzzy entries in .po
-        fuzzy_count = self._count_fuzzy(po_path) if po_exists else 0
-
         # Sort missing by location for easy editing
-        missing_entries.sort(key=lambda e: (e.location, e.line))
+        missing_entries.sort(key=_BY_LOCATION)
 
         report = TranslationReport(
             module_name=self.module_name,
@@ -198,119 +290,171 @@ class TranslationReporter:
             empty_in_po=empty_in_po,
             completion_pct=completion_pct,
             missing_entries=missing_entries,
+            missing_by_type=dict(missing_by_type),
         )
         return report
 
-    def _count_fuzzy(self, po_path: Path) -> int:
-        """Count fuzzy entries in a .po file."""
+    def run_cached(self, cache_dir: Path) -> TranslationReport:
+        """
+        Like run(), but reuse the report stored in cache_dir while neither the
+        module tree nor the .po file has changed since it was written.
+        """
+        po_path = self.module_path / "i18n" / f"{self.lang}.po"
+        try:
+            po_mtime = po_path.stat().st_mtime_ns
+        except OSError:
+            po_mtime = None
+        key = [
+            _REPORT_CACHE_VERSION,
+            _code_digest(),
+            str(self.module_path),
+            self.lang,
+            _tree_mtime_ns(self.module_path),
+            po_mtime,
+        ]
+        name = hashlib.blake2b(
+            f"{self.module_path}\0{self.lang}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cache_path = Path(cache_dir) / f"{name}.json"
+
         try:
-            content = po_path.read_text(encoding="utf-8", errors="replace")
-            return content.count("#, fuzzy")
+            with open(cache_path, "r", encoding="utf-8") as fh:
+                payload = json.load(fh)
+            if payload["key"] == key:
+                print(f"Using cached report for {self.module_name} ({self.lang}): {cache_path}")
+                return _report_from_cache(payload["report"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, stale or unreadable cache: rebuild
+
+        report = self.run()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump({"key": key, "report": _report_to_cache(report)}, fh, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
         except OSError:
-            return 0
+            pass  # The cache is an optimisation only
+        return report
 
 
 # ---------------------------------------------------------------------------
 # Output formatters
 # ---------------------------------------------------------------------------
 
-def format_text(report: TranslationReport, missing_only: bool = False) -> str:
-    """Format report as human-readable text."""
-    lines = [
-        "=" * 65,
-        f"Translation Report: {report.module_name} ({report.language})",
-        "=" * 65,
-        f"Module:        {report.module_path}",
-        f"Language:      {report.language}",
-        f"PO File:       {report.po_file}",
-        f"PO Exists:     {'Yes' if report.po_exists else 'No — run i18n_extractor.py first'}",
-        "",
-        "--- Translation Statistics ---",
-        f"Total strings:    {report.total_strings}",
-        f"Translated:       {report.translated_count} ({report.completion_pct:.1f}%)",
-        f"Missing:          {report.missing_count}",
-        f"Empty in .po:     {report.empty_in_po}",
-        f"Fuzzy:            {report.fuzzy_count}",
-        "",
-    ]
+def write_text(report: TranslationReport, out: TextIO, missing_only: bool = False) -> None:
+    """Write the report as human-readable text to out."""
+    w = out.write
+    w("=" * 65 + "\n")
+    w(f"Translation Report: {report.module_name} ({report.language})\n")
+    w("=" * 65 + "\n")
+    w(f"Module:        {report.module_path}\n")
+    w(f"Language:      {report.language}\n")
+    w(f"PO File:       {report.po_file}\n")
+    w(f"PO Exists:     {'Yes' if report.po_exists else 'No — run i18n_extractor.py first'}\n")
+    w("\n")
+    w("--- Translation Statistics ---\n")
+    w(f"Total strings:    {report.total_strings}\n")
+    w(f"Translated:       {report.translated_count} ({report.completion_pct:.1f}%)\n")
+    w(f"Missing:          {report.missing_count}\n")
+    w(f"Empty in .po:     {report.empty_in_po}\n")
+    w(f"Fuzzy:            {report.fuzzy_count}\n")
+    w("\n")
 
     # Progress bar
     bar_width = 40
     filled = int(bar_width * report.completion_pct / 100)
     bar = "[" + "=" * filled + "-" * (bar_width - filled) + "]"
-    lines.append(f"Progress:      {bar} {report.completion_pct:.1f}%")
-    lines.append("")
+    w(f"Progress:      {bar} {report.completion_pct:.1f}%\n")
+    w("\n")
 
     if not missing_only:
-        # Group missing by file type
-        by_type: Dict[str, List[MissingEntry]] = {}
-        for entry in report.missing_entries:
-            by_type.setdefault(entry.source_file_type, []).append(entry)
+        # Missing by file type (tallied in run(); recount for hand-built reports)
+        by_type = report.missing_by_type or Counter(
+            e.source_file_type for e in report.missing_entries
+        )
 
         if by_type:
-            lines.append("--- Missing by Source Type ---")
+            w("--- Missing by Source Type ---\n")
             for ftype in ("python", "xml", "javascript", "other"):
-                entries = by_type.get(ftype, [])
-                if entries:
-                    lines.append(f"  {ftype.capitalize()}: {len(entries)}")
-            lines.append("")
+                count = by_type.get(ftype, 0)
+                if count:
+                    w(f"  {ftype.capitalize()}: {count}\n")
+            w("\n")
 
     if report.missing_entries:
-        lines.append("--- Missing Translations ---")
-        lines.append(f"(Showing {len(report.missing_entries)} missing entries, sorted by location)")
-        lines.append("")
-
-        current_location = None
-        for entry in report.missing_entries:
-            if entry.location != current_location:
-                current_location = entry.location
-                lines.append(f"  File: {entry.location}")
-
-            # Truncate long msgids
-            msgid_display = entry.msgid.replace("\n", "\\n")
-            if len(msgid_display) > 70:
-                msgid_display = msgid_display[:67] + "..."
-
-            lines.append(f"    [{entry.line:4d}] {msgid_display!r}")
-        lines.append("")
+        w("--- Missing Translations ---\n")
+        w(f"(Showing {len(report.missing_entries)} missing entries, sorted by location)\n")
+        w("\n")
+
+        # missing_entries is sorted by location, so each file is one group
+        for location, entries in groupby(report.missing_entries, key=_LOCATION):
+            w(f"  File: {location}\n")
+            for entry in entries:
+                # Truncate long msgids
+                msgid_display = entry.msgid.replace("\n", "\\n")
+                if len(msgid_display) > 70:
+                    msgid_display = msgid_display[:67] + "..."
+
+                w(f"    [{entry.line:4d}] {msgid_display!r}\n")
+        w("\n")
     else:
-        lines.append("No missing translations found.")
-        lines.append("")
+        w("No missing translations found.\n")
+        w("\n")
 
     # Recommendations
-    lines.append("--- Recommendations ---")
+    w("--- Recommendations ---\n")
     if not report.po_exists:
-        lines.append("  1. Generate .po file: python i18n_extractor.py --module . --lang " + report.language)
+        w("  1. Generate .po file: python i18n_extractor.py --module . --lang " + report.language + "\n")
     elif report.missing_count > 0:
-        lines.append(f"  1. Translate {report.missing_count} missing strings in: {report.po_file}")
-        lines.append("  2. Run i18n_validator.py to check the translated file")
-        lines.append("  3. Update module in Odoo to load new translations")
+        w(f"  1. Translate {report.missing_count} missing strings in: {report.po_file}\n")
+        w("  2. Run i18n_validator.py to check the translated file\n")
+        w("  3. Update module in Odoo to load new translations\n")
     if report.fuzzy_count > 0:
-        lines.append(f"  Review {report.fuzzy_count} fuzzy entries — they need human verification")
+        w(f"  Review {report.fuzzy_count} fuzzy entries — they need human verification\n")
 
     if report.completion_pct == 100.0 and report.fuzzy_count == 0:
-        lines.append("  Translations are complete!")
+        w("  Translations are complete!\n")
 
-    lines.append("")
-    lines.append("=" * 65)
+    w("\n")
+    w("=" * 65)
 
-    return "\n".join(lines)
+
+def write_json(report: TranslationReport, out: TextIO) -> None:
+    """Write the report as JSON to out."""
+    json.dump(report.to_dict(), out, ensure_ascii=False, indent=2)
+
+
+def write_csv(report: TranslationReport, out: TextIO) -> None:
+    """Write missing entries as CSV for spreadsheet editing."""
+    # QUOTE_NONNUMERIC quotes every text column and leaves the line number bare
+    writer = csv.writer(out, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+    out.write("location,line,source_type,msgid\n")
+    writer.writerows(
+        (e.location, e.line, e.source_file_type, e.msgid.replace("\n", "\\n"))
+        for e in report.missing_entries
+    )
+
+
+def format_text(report: TranslationReport, missing_only: bool = False) -> str:
+    """Format report as human-readable text."""
+    buf = io.StringIO()
+    write_text(report, buf, missing_only=missing_only)
+    return buf.getvalue()
 
 
 def format_json(report: TranslationReport) -> str:
     """Format report as JSON."""
-    return json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+    buf = io.StringIO()
+    write_json(report, buf)
+    return buf.getvalue()
 
 
 def format_csv(report: TranslationReport) -> str:
     """Format missing entries as CSV for spreadsheet editing."""
-    rows = [
-        "location,line,source_type,msgid"
-    ]
-    for entry in report.missing_entries:
-        msgid = entry.msgid.replace('"', '""').replace("\n", "\\n")
-        rows.append(f'"{entry.location}",{entry.line},"{entry.source_file_type}","{msgid}"')
-    return "\n".join(rows)
+    buf = io.StringIO()
+    write_csv(report, buf)
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -327,6 +471,7 @@ Examples:
   python i18n_reporter.py --module /path/to/my_module --lang ar --format json
   python i18n_reporter.py --module /path/to/my_module --lang fr --missing-only
   python i18n_reporter.py --module /path/to/my_module --lang tr --output report.txt
+  python i18n_reporter.py --module /path/to/my_module --lang ar --cache-dir .i18n-cache
         """,
     )
     parser.add_argument(
@@ -365,6 +510,14 @@ Examples:
         metavar="PERCENT",
         help="Exit with code 1 if completion is below this threshold (e.g., 80.0)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        default=None,
+        help="Reuse the report cached in DIR while the module and .po file are "
+             "unchanged (default with ODOO_I18N_PARSE_CACHE set: "
+             "$XDG_CACHE_HOME/odoo-i18n)",
+    )
     return parser.parse_args()
 
 
@@ -376,27 +529,34 @@ def main():
         print(f"ERROR: Module path does not exist: {args.module}", file=sys.stderr)
         sys.exit(1)
 
+    cache_dir = args.cache_dir
+    if cache_dir is None and PO_PARSE_CACHE:
+        cache_dir = default_report_cache_dir()
+
     try:
         reporter = TranslationReporter(str(module_path), args.lang)
-        report = reporter.run()
+        report = reporter.run_cached(cache_dir) if cache_dir else reporter.run()
     except ValueError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    # Format output
-    if args.format == "json":
-        output = format_json(report)
-    elif args.format == "csv":
-        output = format_csv(report)
-    else:
-        output = format_text(report, missing_only=args.missing_only)
+    # Format output straight to the destination
+    def write_report(out: TextIO) -> None:
+        if args.format == "json":
+            write_json(report, out)
+        elif args.format == "csv":
+            write_csv(report, out)
+        else:
+            write_text(report, out, missing_only=args.missing_only)
 
-    # Write or print
     if args.output:
-        Path(args.output).write_text(output, encoding="utf-8")
+        with open(args.output, "w", encoding="utf-8") as fh:
+            write_report(fh)
         print(f"Report written to: {args.output}")
     else:
-        print(output)
+        write_report(sys.stdout)
+        if args.format != "csv":  # CSV rows already end with a newline
+            sys.stdout.write("\n")
 
     # Exit code based on threshold
     if args.min_pct is not None and report.completion_pct < args.min_pct:
@@ -12,24 +12,108 @@ Usage:
 """
 
 import argparse
+import io
+import os
 import re
 import sys
 import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 try:
-    from ._common import PoEntry, PoParser
+    from ._common import (
+        _DATACLASS_SLOTS, PO_READ_BUFFER, STATUS_FUZZY, STATUS_HEADER,
+        STATUS_OBSOLETE, STATUS_TRANSLATED, PoEntry, PoParser, entry_status,
+        pool_context,
+    )
 except ImportError:
-    from _common import PoEntry, PoParser
+    from _common import (
+        _DATACLASS_SLOTS, PO_READ_BUFFER, STATUS_FUZZY, STATUS_HEADER,
+        STATUS_OBSOLETE, STATUS_TRANSLATED, PoEntry, PoParser, entry_status,
+        pool_context,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Character classes
+# ---------------------------------------------------------------------------
+
+# Unicode blocks holding every character whose name starts with "ARABIC"
+_ARABIC_BLOCKS = (
+    (0x0600, 0x06FF),    # Arabic
+    (0x0750, 0x077F),    # Arabic Supplement
+    (0x0870, 0x08FF),    # Arabic Extended-B / Extended-A
+    (0xFB50, 0xFDFF),    # Arabic Presentation Forms-A
+    (0xFE70, 0xFEFF),    # Arabic Presentation Forms-B
+    (0x10EC0, 0x10EFF),  # Arabic Extended-C
+    (0x1EE00, 0x1EEFF),  # Arabic Mathematical Alphabetic Symbols
+)
+
+
+def _arabic_char_class() -> str:
+    """Regex character class of the ARABIC-named code points in _ARABIC_BLOCKS."""
+    chars = "".join(
+        chr(cp)
+        for lo, hi in _ARABIC_BLOCKS
+        for cp in range(lo, hi + 1)
+        if unicodedata.name(chr(cp), "").startswith("ARABIC")
+    )
+    return "[" + re.escape(chars) + "]"
+
+
+# Any Arabic letter, digit, mark or sign (searched instead of naming every char)
+_ARABIC_RE = re.compile(_arabic_char_class())
+
+# Left-to-right / right-to-left override characters
+_BIDI_OVERRIDE_RE = re.compile("[\u202d\u202e]")
+
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+# %s, %d, %f, %(name)s style format specifiers; group 1 is the name, if any
+_SPEC_RE = re.compile(r'%(?:\(([^)]+)\))?[sdifro%]')
+
+
+def _scan_specs(text: str) -> Tuple[int, Set[str]]:
+    """Count positional format specifiers in text and collect named ones."""
+    positional = 0
+    named = set()
+    for match in _SPEC_RE.finditer(text):
+        name = match.group(1)
+        if name is None:
+            positional += 1
+        else:
+            named.add(name)
+    return positional, named
+
+
+# Header fields every .po file must declare (Content-Type as text/plain),
+# all found by one scan of the header
+_HEADER_FIELDS = ("Content-Type", "Content-Transfer-Encoding", "MIME-Version", "Language")
+_HEADER_FIELD_RE = re.compile(
+    r"(Content-Type(?=:\s*text/plain)|Content-Transfer-Encoding|MIME-Version|Language):"
+)
+_CHARSET_RE = re.compile(r'charset=([^\s\\]+)', re.IGNORECASE)
+_NPLURALS_RE = re.compile(r'nplurals=(\d+)')
+
+# .po file stem that is a language code (ar, fr, pt_BR)
+_LANG_RE = re.compile(r'^[a-z]{2}(_[A-Z]{2})?$')
 
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Report line prefix per ValidationIssue.severity
+_SEVERITY_PREFIX = {"error": "  [ERROR] ", "warning": "  [WARN ] ", "info": "  [INFO ] "}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationIssue:
     """A single validation finding."""
     severity: str  # "error", "warning", "info"
@@ -38,10 +122,20 @@ class ValidationIssue:
     context: str = ""
 
     def __str__(self):
-        prefix = {"error": "ERROR", "warning": "WARN ", "info": "INFO "}.get(self.severity, "INFO ")
-        loc = f"line {self.line:4d}" if self.line > 0 else "header   "
-        ctx = f" | {self.context}" if self.context else ""
-        return f"  [{prefix}] {loc}: {self.message}{ctx}"
+        buf = io.StringIO()
+        _write_issue(buf, self)
+        return buf.getvalue()[:-1]
+
+
+def _write_issue(buf: io.StringIO, issue: ValidationIssue) -> None:
+    """Write one report line for issue, newline included, to buf."""
+    buf.write(_SEVERITY_PREFIX.get(issue.severity, "  [INFO ] "))
+    buf.write(f"line {issue.line:4d}: " if issue.line > 0 else "header   : ")
+    buf.write(issue.message)
+    if issue.context:
+        buf.write(" | ")
+        buf.write(issue.context)
+    buf.write("\n")
 
 
 # ---------------------------------------------------------------------------
@@ -64,9 +158,23 @@ class PoValidator:
         "\u2066",  # LEFT-TO-RIGHT ISOLATE
         "\u2069",  # POP DIRECTIONAL ISOLATE
     }
-
-    def __init__(self, entries: List[PoEntry], lang: Optional[str] = None, strict: bool = False):
+    RTL_MARKS_RE = re.compile("[" + "".join(sorted(RTL_MARKS)) + "]")
+    RTL_MARK_NAMES = {ch: unicodedata.name(ch) for ch in RTL_MARKS}
+
+    def __init__(
+        self,
+        entries: List[PoEntry],
+        lang: Optional[str] = None,
+        strict: bool = False,
+        status: Optional[Sequence[int]] = None,
+        jobs: Optional[int] = None,
+    ):
         self.entries = entries
+        # One STATUS_* byte per entry (PoParser.status), rebuilt if not given
+        if status is None:
+            status = bytearray(map(entry_status, entries))
+        self.status = status
+        self.jobs = jobs or os.cpu_count() or 1
         self.lang = lang or ""
         self.strict = strict
         self.issues: List[ValidationIssue] = []
@@ -78,20 +186,61 @@ class PoValidator:
             self.issues.append(ValidationIssue("error", 0, "No entries found in .po file"))
             return self.issues
 
-        # Find header entry
+        # Find header entry (normally the first one)
         header = next((e for e in self.entries if e.is_header), None)
         self._check_header(header)
 
-        # Validate individual entries
-        non_header = [e for e in self.entries if not e.is_header]
-        for entry in non_header:
-            self._check_entry(entry)
-
-        # Global checks
-        self._check_duplicate_msgids(non_header)
+        # Validate individual entries and detect duplicate msgids (only the
+        # first wins in gettext) in the same pass; setdefault hashes each
+        # msgid once and returns the first entry seen
+        seen = {}
+        setdefault = seen.setdefault
+        check_entry = self._check_entry
+
+        # Large files: run the per-entry checks in worker processes first,
+        # then merge their issues back in entry order below
+        pooled = None
+        if self.jobs > 1 and len(self.entries) >= PARALLEL_MIN_ENTRIES:
+            pooled = self._check_entries_pooled()
+
+        for i, (entry, st) in enumerate(zip(self.entries, self.status)):
+            # Obsolete ("#~") entries are ignored by gettext: neither checked
+            # nor counted as duplicates of an active msgid
+            if st & (STATUS_HEADER | STATUS_OBSOLETE):
+                continue
+            if pooled is None:
+                check_entry(entry)
+            elif i in pooled:
+                self.issues.extend(pooled[i])
+            first = setdefault(entry.msgid, entry)
+            if first is not entry:
+                self._add("error", entry.line_start,
+                          f"Duplicate msgid — first defined at line {first.line_start}",
+                          context=entry.msgid[:60])
 
         return self.issues
 
+    def _check_entries_pooled(self) -> Dict[int, List[ValidationIssue]]:
+        """Run _check_entry over chunks of entries in a process pool; map entry index -> issues."""
+        global _pool_validator
+        context = pool_context()
+        # Forked workers inherit self and read the entries directly; others
+        # are sent pickled slices
+        inherit = context.get_start_method() == "fork"
+        tasks = [
+            (i, i + PARALLEL_CHUNK, None if inherit else (
+                self.entries[i:i + PARALLEL_CHUNK], self.status[i:i + PARALLEL_CHUNK],
+                self.lang, self.strict,
+            ))
+            for i in range(0, len(self.entries), PARALLEL_CHUNK)
+        ]
+        _pool_validator = self
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs, mp_context=context) as pool:
+                return {i: found for chunk in pool.map(_check_chunk, tasks) for i, found in chunk}
+        finally:
+            _pool_validator = None
+
     def _add(self, severity: str, line: int, message: str, context: str = ""):
         self.issues.append(ValidationIssue(severity, line, message, context))
 
@@ -102,20 +251,14 @@ class PoValidator:
             return
 
         msgstr = header.msgstr
-        required_fields = [
-            ("Content-Type", r"Content-Type:\s*text/plain"),
-            ("Content-Transfer-Encoding", r"Content-Transfer-Encoding:"),
-            ("MIME-Version", r"MIME-Version:"),
-            ("Language", r"Language:"),
-        ]
-
-        for field_name, pattern in required_fields:
-            if not re.search(pattern, msgstr):
+        found = set(_HEADER_FIELD_RE.findall(msgstr))
+        for field_name in _HEADER_FIELDS:
+            if field_name not in found:
                 self._add("warning", header.line_start,
                           f"Header missing field: {field_name}")
 
         # Check charset
-        charset_match = re.search(r'charset=([^\s\\]+)', msgstr, re.IGNORECASE)
+        charset_match = _CHARSET_RE.search(msgstr)
         if charset_match:
             charset = charset_match.group(1).strip('"').lower()
             if charset not in ("utf-8", "utf8"):
@@ -130,7 +273,7 @@ class PoValidator:
                 self._add("warning", header.line_start,
                           "Arabic .po file missing Plural-Forms header")
             else:
-                plural_match = re.search(r'nplurals=(\d+)', msgstr)
+                plural_match = _NPLURALS_RE.search(msgstr)
                 if plural_match:
                     nplurals = int(plural_match.group(1))
                     if nplurals != 6:
@@ -173,25 +316,17 @@ class PoValidator:
 
     def _check_format_specifiers(self, entry: PoEntry, lineno: int):
         """Check that format specifiers in msgstr match msgid."""
-        # Find all %s, %d, %f, %(name)s style specifiers
-        spec_pattern = re.compile(r'%(?:\([^)]+\))?[sdifro%]')
-
-        src_specs = spec_pattern.findall(entry.msgid)
-        dst_specs = spec_pattern.findall(entry.msgstr) if entry.msgstr else []
+        src_positional, src_named = _scan_specs(entry.msgid)
+        dst_positional, dst_named = _scan_specs(entry.msgstr)
 
         # For positional specifiers, count must match
-        src_positional = [s for s in src_specs if not s.startswith("%(")]
-        dst_positional = [s for s in dst_specs if not s.startswith("%(")]
-
-        if len(src_positional) != len(dst_positional):
+        if src_positional != dst_positional:
             self._add("error", lineno,
-                      f"Format specifier mismatch: source has {len(src_positional)}, "
-                      f"translation has {len(dst_positional)}",
+                      f"Format specifier mismatch: source has {src_positional}, "
+                      f"translation has {dst_positional}",
                       context=entry.msgid[:60])
 
         # For named specifiers, all names must appear in translation
-        src_named = {re.search(r'\(([^)]+)\)', s).group(1) for s in src_specs if "(" in s}
-        dst_named = {re.search(r'\(([^)]+)\)', s).group(1) for s in dst_specs if "(" in s}
         missing_named = src_named - dst_named
         if missing_named:
             self._add("error", lineno,
@@ -203,11 +338,7 @@ class PoValidator:
         msgstr = entry.msgstr
 
         # Check that Arabic translation actually contains Arabic characters
-        has_arabic = any(
-            unicodedata.name(ch, "").startswith("ARABIC")
-            for ch in msgstr
-            if ch.strip()
-        )
+        has_arabic = _ARABIC_RE.search(msgstr) is not None
         if not has_arabic and len(msgstr.strip()) > 2:
             self._add("warning", lineno,
                       "Translation appears to have no Arabic characters",
@@ -221,9 +352,10 @@ class PoValidator:
                       context=msgstr[:60])
 
         # Check for unnecessary RTL marks
-        suspicious_marks = [ch for ch in msgstr if ch in self.RTL_MARKS]
+        suspicious_marks = self.RTL_MARKS_RE.findall(msgstr)
         if suspicious_marks:
-            mark_names = [unicodedata.name(m, repr(m)) for m in set(suspicious_marks)]
+            # Each distinct mark once, in order of first appearance
+            mark_names = [self.RTL_MARK_NAMES[m] for m in dict.fromkeys(suspicious_marks)]
             self._add("info", lineno,
                       f"Translation contains direction control characters: {mark_names}. "
                       "These are usually not needed in .po files.",
@@ -235,8 +367,7 @@ class PoValidator:
             return
 
         # Check for override characters (potential security/display issue)
-        override_chars = [ch for ch in entry.msgstr if ch in {"\u202e", "\u202d"}]
-        if override_chars:
+        if _BIDI_OVERRIDE_RE.search(entry.msgstr):
             self._add("error", lineno,
                       "Translation contains BIDI override characters — potential security issue")
 
@@ -245,34 +376,66 @@ class PoValidator:
         if not entry.msgstr:
             return
 
-        # Leading/trailing whitespace should match
-        src_leading = len(entry.msgid) - len(entry.msgid.lstrip())
-        dst_leading = len(entry.msgstr) - len(entry.msgstr.lstrip())
+        msgid = entry.msgid
+        msgstr = entry.msgstr
+
+        # Leading/trailing whitespace should match; only strings that start
+        # or end with whitespace are stripped (copied) to measure it
+        src_leading = len(msgid) - len(msgid.lstrip()) if msgid[:1].isspace() else 0
+        dst_leading = len(msgstr) - len(msgstr.lstrip()) if msgstr[:1].isspace() else 0
         if src_leading != dst_leading and (src_leading > 0 or dst_leading > 0):
             self._add("info", lineno,
                       f"Leading whitespace differs: source has {src_leading} space(s), "
                       f"translation has {dst_leading}",
                       context=entry.msgid[:40])
 
-        src_trailing = len(entry.msgid) - len(entry.msgid.rstrip())
-        dst_trailing = len(entry.msgstr) - len(entry.msgstr.rstrip())
+        src_trailing = len(msgid) - len(msgid.rstrip()) if msgid[-1:].isspace() else 0
+        dst_trailing = len(msgstr) - len(msgstr.rstrip()) if msgstr[-1:].isspace() else 0
         if src_trailing != dst_trailing and (src_trailing > 0 or dst_trailing > 0):
             self._add("info", lineno,
                       f"Trailing whitespace differs: source has {src_trailing}, "
                       f"translation has {dst_trailing}",
                       context=entry.msgid[:40])
 
-    def _check_duplicate_msgids(self, entries: List[PoEntry]):
-        """Check for duplicate msgid entries (only first wins in gettext)."""
-        seen = {}
-        for entry in entries:
-            key = entry.msgid
-            if key in seen:
-                self._add("error", entry.line_start,
-                          f"Duplicate msgid — first defined at line {seen[key]}",
-                          context=entry.msgid[:60])
-            else:
-                seen[key] = entry.line_start
+
+# Files with fewer entries than this are validated in-process: pool start-up
+# and pickling the entries would cost more than they save.
+PARALLEL_MIN_ENTRIES = 50000
+
+# Entries per worker task
+PARALLEL_CHUNK = 5000
+
+
+# Validator whose entries a process pool is checking; forked workers read
+# them from here instead of receiving pickled copies
+_pool_validator: Optional[PoValidator] = None
+
+
+def _check_chunk(
+    task: Tuple[int, int, Optional[tuple]],
+) -> List[Tuple[int, List[ValidationIssue]]]:
+    """
+    Run the per-entry checks on entries[start:stop] (module-level so worker
+    processes can pickle it); returns (entry index, issues) for each entry
+    with findings.
+    """
+    start, stop, chunk = task
+    if chunk is None:
+        parent = _pool_validator
+        chunk = (parent.entries[start:stop], parent.status[start:stop], parent.lang, parent.strict)
+    entries, status, lang, strict = chunk
+
+    validator = PoValidator(entries, lang=lang, strict=strict, status=status, jobs=1)
+    issues = validator.issues
+    found = []
+    for i, (entry, st) in enumerate(zip(entries, status)):
+        if st & (STATUS_HEADER | STATUS_OBSOLETE):
+            continue
+        validator._check_entry(entry)
+        if issues:
+            found.append((start + i, issues[:]))
+            issues.clear()
+    return found
 
 
 # ---------------------------------------------------------------------------
@@ -285,14 +448,23 @@ def generate_report(
     issues: List[ValidationIssue],
     parse_errors: List[Tuple[int, str]],
     lang: Optional[str] = None,
+    status: Optional[Sequence[int]] = None,
 ) -> str:
     """Build a human-readable validation report."""
-    non_header = [e for e in entries if not e.is_header and not e.is_obsolete]
-    total = len(non_header)
-    translated = sum(1 for e in non_header if e.msgstr)
+    # Tally entries per distinct STATUS_* byte (at most 16 values)
+    if status is None:
+        status = map(entry_status, entries)
+    total = translated = fuzzy = obsolete = 0
+    for st, count in Counter(status).items():
+        if st & STATUS_OBSOLETE:
+            obsolete += count
+        elif not st & STATUS_HEADER:
+            total += count
+            if st & STATUS_TRANSLATED:
+                translated += count
+            if st & STATUS_FUZZY:
+                fuzzy += count
     untranslated = total - translated
-    fuzzy = sum(1 for e in non_header if e.is_fuzzy)
-    obsolete = sum(1 for e in entries if e.is_obsolete)
 
     pct = (translated / total * 100) if total > 0 else 0
 
@@ -300,51 +472,41 @@ def generate_report(
     warnings = [i for i in issues if i.severity == "warning"]
     infos = [i for i in issues if i.severity == "info"]
 
-    lines = [
-        "=" * 60,
-        f"Validation Report: {Path(po_path).name}",
-        "=" * 60,
-        f"Language:         {lang or 'unknown'}",
-        f"File:             {po_path}",
-        "",
-        "--- Translation Statistics ---",
-        f"Total entries:    {total}",
-        f"Translated:       {translated} ({pct:.1f}%)",
-        f"Untranslated:     {untranslated}",
-        f"Fuzzy:            {fuzzy}",
-        f"Obsolete:         {obsolete}",
-        "",
-        "--- Validation Summary ---",
-        f"Parse errors:     {len(parse_errors)}",
-        f"Errors:           {len(errors)}",
-        f"Warnings:         {len(warnings)}",
-        f"Info notes:       {len(infos)}",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        f"{'=' * 60}\n"
+        f"Validation Report: {Path(po_path).name}\n"
+        f"{'=' * 60}\n"
+        f"Language:         {lang or 'unknown'}\n"
+        f"File:             {po_path}\n"
+        "\n"
+        "--- Translation Statistics ---\n"
+        f"Total entries:    {total}\n"
+        f"Translated:       {translated} ({pct:.1f}%)\n"
+        f"Untranslated:     {untranslated}\n"
+        f"Fuzzy:            {fuzzy}\n"
+        f"Obsolete:         {obsolete}\n"
+        "\n"
+        "--- Validation Summary ---\n"
+        f"Parse errors:     {len(parse_errors)}\n"
+        f"Errors:           {len(errors)}\n"
+        f"Warnings:         {len(warnings)}\n"
+        f"Info notes:       {len(infos)}\n"
+        "\n"
+    )
 
     if parse_errors:
-        lines.append("--- Parse Errors ---")
+        buf.write("--- Parse Errors ---\n")
         for lineno, msg in parse_errors:
-            lines.append(f"  [PARSE ERROR] line {lineno:4d}: {msg}")
-        lines.append("")
-
-    if errors:
-        lines.append("--- Errors ---")
-        for issue in errors:
-            lines.append(str(issue))
-        lines.append("")
-
-    if warnings:
-        lines.append("--- Warnings ---")
-        for issue in warnings:
-            lines.append(str(issue))
-        lines.append("")
-
-    if infos:
-        lines.append("--- Info Notes ---")
-        for issue in infos:
-            lines.append(str(issue))
-        lines.append("")
+            buf.write(f"  [PARSE ERROR] line {lineno:4d}: {msg}\n")
+        buf.write("\n")
+
+    for title, group in (("Errors", errors), ("Warnings", warnings), ("Info Notes", infos)):
+        if group:
+            buf.write(f"--- {title} ---\n")
+            for issue in group:
+                _write_issue(buf, issue)
+            buf.write("\n")
 
     # Overall result
     if parse_errors or errors:
@@ -354,11 +516,9 @@ def generate_report(
     else:
         status = "PASSED — File is valid"
 
-    lines.append("=" * 60)
-    lines.append(f"Result: {status}")
-    lines.append("=" * 60)
+    buf.write(f"{'=' * 60}\nResult: {status}\n{'=' * 60}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -400,13 +560,22 @@ Examples:
         default=None,
         help="Write validation report to a file instead of stdout",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help=f"Worker processes for files with {PARALLEL_MIN_ENTRIES}+ entries "
+             "(default: CPU count, 1 = no pool)",
+    )
     return parser.parse_args()
 
 
 def detect_lang_from_filename(filepath: str) -> Optional[str]:
     """Try to detect language code from .po filename (e.g., ar.po -> ar)."""
     name = Path(filepath).stem  # Remove .po extension
-    if re.match(r'^[a-z]{2}(_[A-Z]{2})?$', name):
+    if _LANG_RE.match(name):
         return name
     return None
 
@@ -426,29 +595,40 @@ def main():
     lang = args.lang or detect_lang_from_filename(str(po_path))
 
     # Read and check encoding
+    with open(po_path, "rb") as fh:
+        has_bom = fh.read(3) == b"\xef\xbb\xbf"
+    if has_bom:
+        print("WARNING: File has UTF-8 BOM. Odoo prefers BOM-less UTF-8.")
+
+    # Parse, decoding lines as they are read: the file is never held in
+    # memory as a whole
     try:
-        raw_bytes = po_path.read_bytes()
-        # Detect BOM
-        if raw_bytes.startswith(b"\xef\xbb\xbf"):
-            print("WARNING: File has UTF-8 BOM. Odoo prefers BOM-less UTF-8.")
-            content = raw_bytes[3:].decode("utf-8")
-        else:
-            content = raw_bytes.decode("utf-8")
+        with open(
+            po_path, "r", encoding="utf-8-sig", newline="", buffering=PO_READ_BUFFER,
+        ) as fh:
+            parser = PoParser(lines_iter=fh, strict=True)
+            entries = parser.parse()
     except UnicodeDecodeError as exc:
+        # The streaming decoder reports offsets within its read buffer;
+        # decode the whole file once to report the absolute position
+        try:
+            po_path.read_bytes()[3 if has_bom else 0:].decode("utf-8")
+        except UnicodeDecodeError as whole_exc:
+            exc = whole_exc
         print(f"ERROR: File is not valid UTF-8: {exc}", file=sys.stderr)
         print("Odoo requires .po files to be UTF-8 encoded.", file=sys.stderr)
         sys.exit(1)
 
-    # Parse
-    parser = PoParser(content, strict=True)
-    entries = parser.parse()
-
     # Validate
-    validator = PoValidator(entries, lang=lang, strict=args.strict)
+    validator = PoValidator(
+        entries, lang=lang, strict=args.strict, status=parser.status, jobs=args.jobs,
+    )
     issues = validator.validate_all()
 
     # Generate report
-    report = generate_report(str(po_path), entries, issues, parser.parse_errors, lang=lang)
+    report = generate_report(
+        str(po_path), entries, issues, parser.parse_errors, lang=lang, status=parser.status,
+    )
 
     if args.output:
         output_path = Path(args.output)
@@ -0,0 +1,86 @@
+"""
+Regression checks for obsolete ("#~") entries in merge and validation.
+
+Run from the plugin directory:
+    python -m unittest discover -s odoo-i18n/tests
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from _common import parse_po_file  # noqa: E402
+from i18n_converter import action_merge  # noqa: E402
+from i18n_validator import PoValidator  # noqa: E402
+
+HEADER = (
+    'msgid ""\n'
+    'msgstr ""\n'
+    '"Content-Type: text/plain; charset=UTF-8\\n"\n'
+    '"Content-Transfer-Encoding: 8bit\\n"\n'
+    '"MIME-Version: 1.0\\n"\n'
+    '"Language: fr\\n"\n'
+    "\n"
+)
+
+
+class ObsoleteEntriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, body: str) -> Path:
+        path = self.tmp / name
+        path.write_text(HEADER + body, encoding="utf-8")
+        return path
+
+    def _merge(self, base: Path, new: Path) -> dict:
+        out = self.tmp / "out.po"
+        with contextlib.redirect_stdout(io.StringIO()):
+            action_merge(base, new, out)
+        return {e.msgid: e for e in parse_po_file(out) if not e.is_header}
+
+    def test_merge_revives_obsolete_translation(self):
+        base = self._write("base.po", '#~ msgid "Old"\n#~ msgstr "Ancien"\n')
+        new = self._write("new.po", 'msgid "Old"\nmsgstr ""\n')
+        merged = self._merge(base, new)
+        self.assertEqual(merged["Old"].msgstr, "Ancien")
+        self.assertFalse(merged["Old"].is_obsolete)
+
+    def test_merge_prefers_active_base_entry(self):
+        base = self._write(
+            "base.po",
+            'msgid "Save"\nmsgstr "Enregistrer"\n\n#~ msgid "Save"\n#~ msgstr "Sauver"\n',
+        )
+        new = self._write("new.po", 'msgid "Save"\nmsgstr ""\n')
+        merged = self._merge(base, new)
+        self.assertEqual(merged["Save"].msgstr, "Enregistrer")
+        self.assertFalse(merged["Save"].is_obsolete)
+
+    def test_merge_ignores_obsolete_entries_of_new_file(self):
+        base = self._write("base.po", 'msgid "Keep"\nmsgstr "Garder"\n')
+        new = self._write(
+            "new.po", 'msgid "Keep"\nmsgstr ""\n\n#~ msgid "Ghost"\n#~ msgstr ""\n'
+        )
+        self.assertNotIn("Ghost", self._merge(base, new))
+
+    def test_obsolete_copy_is_not_a_duplicate(self):
+        po = self._write(
+            "fr.po",
+            'msgid "Save"\nmsgstr "Enregistrer"\n\n#~ msgid "Save"\n#~ msgstr "Sauver"\n',
+        )
+        issues = PoValidator(parse_po_file(po), lang="fr", jobs=1).validate_all()
+        self.assertEqual([i for i in issues if i.severity == "error"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ Usage:
 Options:
     --json     Output results as JSON (used by security_auditor.py orchestrator)
     --verbose  Show detailed per-model information
+    --jobs N   Worker processes for parsing model files (default: CPU count)
 
 Exit codes:
     0 = No issues found
@@ -26,6 +27,12 @@ import ast
 import csv
 import json
 import argparse
+import hashlib
+import multiprocessing
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
@@ -56,24 +63,202 @@ ABSTRACT_NAME_PATTERNS = [
     r'^mail\.activity',
 ]
 
+# Regex fallback for files that can't be AST-parsed: _name assignments (kept
+# within one line), and the TransientModel/AbstractModel class line looked up
+# a few lines above
+NAME_ASSIGN_REGEX = re.compile(r"_name[^\S\n]*=[^\S\n]*['\"]([^'\"\n]+)['\"]")
+TRANSIENT_CLASS_REGEX = re.compile(r'class\s+\w+\s*\(.*TransientModel.*\)')
+ABSTRACT_CLASS_REGEX = re.compile(r'class\s+\w+\s*\(.*AbstractModel.*\)')
 
-def find_python_files(directory: Path) -> List[Path]:
-    """Find all Python files in a directory, excluding tests."""
-    files = []
-    for py_file in directory.rglob('*.py'):
-        # Skip test files
-        if 'test' in py_file.parts:
+# <record id="..." model="res.groups"> group definitions in XML data files,
+# matched on raw bytes. Files are scanned as one blob joined with
+# XML_FILE_SEPARATOR: its quotes and '>' end any unterminated <record tag,
+# so a match never spans two files.
+GROUP_RECORD_REGEX = re.compile(rb'<record\s[^>]*id=["\']([^"\']+)["\'][^>]*model=["\']res\.groups["\']')
+XML_FILE_SEPARATOR = b'\n"\'>\n'
+
+# Group ids (lowercased) trusted with full CRUD including delete
+MANAGER_GROUP_REGEX = re.compile(r'manager|admin|system')
+
+# company_id = fields.Many2one('res.company', ...) model fields
+COMPANY_FIELD_REGEX = re.compile(r"company_id\s*=\s*fields\.(Many2one|Integer)\s*\(\s*['\"]res\.company['\"]")
+
+# Modules with fewer model files than this are parsed in-process: worker
+# start-up would cost more than it saves
+PARALLEL_MIN_FILES = 16
+
+
+def _pool_context():
+    """Worker pool context: fork on POSIX so workers skip re-importing this script."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+# Opt-in on-disk cache of per-file results (extracted models, parsed access
+# CSV), so repeated audits of an unchanged module only stat its files
+RESULT_CACHE = os.environ.get('ODOO_SECURITY_CACHE', '') not in ('', '0')
+_RESULT_CACHE_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """$XDG_CACHE_HOME/odoo-security/access.pkl, falling back to ~/.cache."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'odoo-security' / 'access.pkl'
+
+
+def _result_cache_header() -> tuple:
+    """Identify this script's code: a cache written by other code is discarded."""
+    with open(__file__, 'rb') as fh:
+        digest = hashlib.sha1(fh.read()).hexdigest()
+    return (_RESULT_CACHE_VERSION, digest)
+
+
+class ResultCache:
+    """
+    Per-file results kept across runs in a pickle file.
+
+    Entries are keyed by (kind, path) and only reused while the file's
+    (st_ino, st_mtime_ns, st_size) is unchanged. A missing, foreign or
+    corrupt cache file starts out empty; write errors are ignored.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[Tuple[str, str], tuple] = {}
+        self.dirty = False
+        try:
+            with open(path, 'rb') as fh:
+                header, entries = pickle.load(fh)
+            if header == _result_cache_header():
+                self.entries = entries
+        except Exception:
+            pass
+
+    @staticmethod
+    def file_key(path: Path) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def get(self, kind: str, path: Path, key: Optional[tuple]):
+        """Return the cached result for path, or None when missing or stale."""
+        hit = self.entries.get((kind, str(path)))
+        if hit is None or key is None or hit[0] != key:
+            return None
+        return hit[1]
+
+    def put(self, kind: str, path: Path, key: Optional[tuple], result) -> None:
+        if key is not None:
+            self.entries[(kind, str(path))] = (key, result)
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed (via a temp file, then rename)."""
+        if not self.dirty:
+            return
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as fh:
+                pickle.dump((_result_cache_header(), self.entries), fh,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def prefetch_files(paths: List[Path]) -> None:
+    """
+    Ask the kernel to start reading files into the page cache.
+
+    Issues POSIX_FADV_WILLNEED for every file up front so cold-cache reads
+    overlap instead of each file blocking in turn when it is parsed. A no-op
+    where os.posix_fadvise is unavailable (Windows, macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
             continue
-        if py_file.name.startswith('test_'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# Columns of security/ir.model.access.csv
+ACCESS_CSV_COLUMNS = ('id', 'name', 'model_id:id', 'group_id:id',
+                      'perm_read', 'perm_write', 'perm_create', 'perm_unlink')
+
+
+def scan_module_files(root: Path) -> Tuple[List[Path], List[Path]]:
+    """
+    Find Python files (excluding tests) and all XML files under root.
+
+    One os.scandir walk serves both lists; directory entries carry their
+    type, so nothing is stat'ed twice. Symlinked directories are not
+    entered, as with Path.rglob. Python files under a directory named
+    'test', or named test_*.py, are skipped. The Python files are sorted
+    as sorted() orders Paths.
+    """
+    py_files = []
+    xml_files = []
+    stack = [(os.fspath(root), False)]
+    while stack:
+        dir_path, in_test = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, in_test or name == 'test'))
+                    elif name.endswith('.py'):
+                        if not in_test and not name.startswith('test_'):
+                            py_files.append(entry.path)
+                    elif name.endswith('.xml'):
+                        xml_files.append(entry.path)
+        except OSError:
             continue
-        files.append(py_file)
-    return sorted(files)
+    py_files.sort(key=lambda p: os.path.normcase(p).split(os.sep))
+    return [Path(p) for p in py_files], [Path(p) for p in xml_files]
+
+
+def find_python_files(directory: Path) -> List[Path]:
+    """Find all Python files in a directory, excluding tests."""
+    return scan_module_files(directory)[0]
 
 
-def extract_models_from_file(file_path: Path) -> List[Dict]:
+def scan_model_file(file_path: Path) -> Tuple[List[Dict], bool]:
+    """
+    Read a Python file once and run every per-file check on it.
+
+    Returns (models, has_company_field): the extract_models_from_file()
+    result, and whether the file declares a res.company company_id field.
+    An unreadable file yields ([], False).
+    """
+    try:
+        source = file_path.read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return [], False
+    models = extract_models_from_file(file_path, source)
+    return models, bool(COMPANY_FIELD_REGEX.search(source))
+
+
+def extract_models_from_file(file_path: Path, source: Optional[str] = None) -> List[Dict]:
     """
     Extract all Odoo model definitions from a Python file.
 
+    source is the file's text when the caller has already read it.
+
     Returns list of dicts with:
         - name: model technical name (_name value)
         - inherit: inherited model name (_inherit value) if no _name set
@@ -84,10 +269,16 @@ def extract_models_from_file(file_path: Path) -> List[Dict]:
     """
     models = []
 
-    try:
-        source = file_path.read_text(encoding='utf-8', errors='replace')
-    except (OSError, IOError) as e:
-        return []
+    if source is None:
+        try:
+            source = file_path.read_text(encoding='utf-8', errors='replace')
+        except (OSError, IOError) as e:
+            return []
+
+    # No class statement, no model (e.g. __init__.py, helper modules):
+    # skip parsing altogether
+    if 'class' not in source:
+        return models
 
     try:
         tree = ast.parse(source)
@@ -95,7 +286,10 @@ def extract_models_from_file(file_path: Path) -> List[Dict]:
         # Fall back to regex parsing for malformed files
         return extract_models_regex(source, file_path)
 
-    for node in ast.walk(tree):
+    # Odoo models are module-level classes whose _name/_inherit are plain
+    # class-body assignments, so neither method bodies nor nested
+    # statements need to be visited
+    for node in tree.body:
         if not isinstance(node, ast.ClassDef):
             continue
 
@@ -105,7 +299,7 @@ def extract_models_from_file(file_path: Path) -> List[Dict]:
             if isinstance(base, ast.Attribute):
                 base_names.append(f"{base.value.id if isinstance(base.value, ast.Name) else '?'}.{base.attr}")
             elif isinstance(base, ast.Name):
-                base_names.append(base.name)
+                base_names.append(base.id)
 
         is_odoo_model = any(
             'Model' in b or 'model' in b.lower()
@@ -121,20 +315,23 @@ def extract_models_from_file(file_path: Path) -> List[Dict]:
         model_name = None
         inherit = None
 
-        for item in ast.walk(node):
-            if isinstance(item, ast.Assign):
-                for target in item.targets:
-                    if isinstance(target, ast.Name):
-                        if target.id == '_name' and isinstance(item.value, ast.Constant):
-                            model_name = item.value.value
-                        elif target.id == '_inherit':
-                            if isinstance(item.value, ast.Constant):
-                                inherit = item.value.value
-                            elif isinstance(item.value, ast.List):
-                                inherit = [
-                                    elt.value for elt in item.value.elts
-                                    if isinstance(elt, ast.Constant)
-                                ]
+        for item in node.body:
+            if not isinstance(item, ast.Assign):
+                continue
+            value = item.value
+            for target in item.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == '_name' and isinstance(value, ast.Constant):
+                    model_name = value.value
+                elif target.id == '_inherit':
+                    if isinstance(value, ast.Constant):
+                        inherit = value.value
+                    elif isinstance(value, ast.List):
+                        inherit = [
+                            elt.value for elt in value.elts
+                            if isinstance(elt, ast.Constant)
+                        ]
 
         # Skip classes that don't define or inherit a model
         if not model_name and not inherit:
@@ -164,31 +361,39 @@ def extract_models_regex(source: str, file_path: Path) -> List[Dict]:
     """
     models = []
 
-    # Find _name = 'something' assignments
-    name_pattern = re.compile(r"_name\s*=\s*['\"]([^'\"]+)['\"]")
-    inherit_pattern = re.compile(r"_inherit\s*=\s*['\"]([^'\"]+)['\"]")
-    transient_pattern = re.compile(r'class\s+\w+\s*\(.*TransientModel.*\)')
-    abstract_pattern = re.compile(r'class\s+\w+\s*\(.*AbstractModel.*\)')
-
-    lines = source.split('\n')
-    for i, line in enumerate(lines, 1):
-        name_match = name_pattern.search(line)
-        if name_match:
-            model_name = name_match.group(1)
-            # Look back a few lines for the class definition
-            lookback = '\n'.join(lines[max(0, i-10):i])
-            is_transient = bool(transient_pattern.search(lookback))
-            is_abstract = bool(abstract_pattern.search(lookback))
-            if not is_abstract:
-                models.append({
-                    'name': model_name,
-                    'inherit': None,
-                    'is_transient': bool(is_transient),
-                    'is_abstract': False,
-                    'line': i,
-                    'class_name': 'unknown',
-                    'file': str(file_path),
-                })
+    # One pass over the whole source finds the _name = 'something'
+    # assignments; line numbers are kept up to date by counting the
+    # newlines between consecutive matches
+    i = 1
+    prev = last_line = 0
+    for name_match in NAME_ASSIGN_REGEX.finditer(source):
+        pos = name_match.start()
+        i += source.count('\n', prev, pos)
+        prev = pos
+        if i == last_line:
+            continue  # Only the first assignment on a line counts
+        last_line = i
+        model_name = name_match.group(1)
+        # Look back a few lines for the class definition
+        start = pos
+        for _ in range(10):
+            start = source.rfind('\n', 0, start)
+            if start < 0:
+                break
+        end = source.find('\n', pos)
+        lookback = source[start + 1:end if end >= 0 else len(source)]
+        is_transient = bool(TRANSIENT_CLASS_REGEX.search(lookback))
+        is_abstract = bool(ABSTRACT_CLASS_REGEX.search(lookback))
+        if not is_abstract:
+            models.append({
+                'name': model_name,
+                'inherit': None,
+                'is_transient': bool(is_transient),
+                'is_abstract': False,
+                'line': i,
+                'class_name': 'unknown',
+                'file': str(file_path),
+            })
 
     return models
 
@@ -206,46 +411,64 @@ def parse_access_csv(csv_path: Path) -> Tuple[List[Dict], List[str]]:
     """
     Parse ir.model.access.csv file.
 
+    Results are memoized for the life of the process, keyed on the file's
+    path, mtime and size; callers must not modify the returned lists.
+
     Returns:
         (rows, errors) where rows is list of parsed access rule dicts
     """
-    if not csv_path.exists():
+    try:
+        st = os.stat(csv_path)
+    except OSError:
         return [], []
+    return _parse_access_csv(str(csv_path), st.st_mtime_ns, st.st_size)
+
 
+@lru_cache(maxsize=32)
+def _parse_access_csv(csv_path: str, mtime_ns: int, size: int) -> Tuple[List[Dict], List[str]]:
     rows = []
     errors = []
 
     try:
         with open(csv_path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
 
-            expected_cols = {'id', 'name', 'model_id:id', 'group_id:id',
-                             'perm_read', 'perm_write', 'perm_create', 'perm_unlink'}
-
-            if reader.fieldnames:
-                missing_cols = expected_cols - set(reader.fieldnames)
+            if header:
+                missing_cols = set(ACCESS_CSV_COLUMNS) - set(header)
                 if missing_cols:
                     errors.append(f"Missing CSV columns: {', '.join(sorted(missing_cols))}")
 
-            for line_num, row in enumerate(reader, start=2):  # 2 because row 1 is header
-                if not any(row.values()):
+            # Column positions; a missing column points at the empty cell
+            # every row is padded with
+            width = len(header)
+            col = {name: i for i, name in enumerate(header)}
+            (i_id, i_name, i_model, i_group,
+             i_read, i_write, i_create, i_unlink) = [col.get(name, width) for name in ACCESS_CSV_COLUMNS]
+
+            # Blank lines are skipped without being counted, as csv.DictReader does
+            for line_num, row in enumerate(filter(None, reader), start=2):  # 2 because row 1 is header
+                if not any(row):
                     continue  # Skip empty rows
+                if len(row) > width:
+                    del row[width:]
+                row.extend([''] * (width + 1 - len(row)))
 
                 # Validate required fields
-                model_id = row.get('model_id:id', '').strip()
+                model_id = row[i_model].strip()
                 if not model_id:
                     errors.append(f"Line {line_num}: Empty model_id:id")
                     continue
 
                 rows.append({
-                    'id': row.get('id', '').strip(),
-                    'name': row.get('name', '').strip(),
+                    'id': row[i_id].strip(),
+                    'name': row[i_name].strip(),
                     'model_id': model_id,
-                    'group_id': row.get('group_id:id', '').strip(),
-                    'perm_read': row.get('perm_read', '0').strip() == '1',
-                    'perm_write': row.get('perm_write', '0').strip() == '1',
-                    'perm_create': row.get('perm_create', '0').strip() == '1',
-                    'perm_unlink': row.get('perm_unlink', '0').strip() == '1',
+                    'group_id': row[i_group].strip(),
+                    'perm_read': row[i_read].strip() == '1',
+                    'perm_write': row[i_write].strip() == '1',
+                    'perm_create': row[i_create].strip() == '1',
+                    'perm_unlink': row[i_unlink].strip() == '1',
                     'line': line_num,
                 })
     except Exception as e:
@@ -254,8 +477,13 @@ def parse_access_csv(csv_path: Path) -> Tuple[List[Dict], List[str]]:
     return rows, errors
 
 
-def find_defined_groups(module_path: Path) -> set:
-    """Scan security XML files to find all defined group XML IDs."""
+def find_defined_groups(module_path: Path, xml_files: Optional[List[Path]] = None) -> set:
+    """
+    Scan security XML files to find all defined group XML IDs.
+
+    xml_files lists the module's XML files when the caller already has
+    them (see scan_module_files); otherwise the module is walked here.
+    """
     group_ids = set()
     security_dir = module_path / 'security'
 
@@ -263,22 +491,23 @@ def find_defined_groups(module_path: Path) -> set:
         return group_ids
 
     # Also check all XML files in the module
-    xml_files = list(module_path.rglob('*.xml'))
-
-    group_pattern = re.compile(r'<record\s[^>]*id=["\']([^"\']+)["\'][^>]*model=["\']res\.groups["\']')
-    id_pattern = re.compile(r'<record[^>]+id=["\']([^"\']+)["\']')
+    if xml_files is None:
+        xml_files = scan_module_files(module_path)[1]
 
+    contents = []
     for xml_file in xml_files:
         try:
-            content = xml_file.read_text(encoding='utf-8', errors='replace')
-            # Find group definitions
-            for match in group_pattern.finditer(content):
-                group_ids.add(match.group(1))
-                module_name = module_path.name
-                group_ids.add(f"{module_name}.{match.group(1)}")
-        except (OSError, IOError):
+            contents.append(xml_file.read_bytes())
+        except OSError:
             continue
 
+    # Find group definitions in one pass over all files
+    prefix = f"{module_path.name}."
+    for match in GROUP_RECORD_REGEX.finditer(XML_FILE_SEPARATOR.join(contents)):
+        group_id = match.group(1).decode('utf-8', errors='replace')
+        group_ids.add(group_id)
+        group_ids.add(prefix + group_id)
+
     # Add known Odoo base group IDs
     known_base_groups = {
         'base.group_user', 'base.group_system', 'base.group_erp_manager',
@@ -300,12 +529,25 @@ def find_defined_groups(module_path: Path) -> set:
     return group_ids
 
 
-def check_access_rules(module_path: Path) -> List[Dict]:
+def check_access_rules(module_path: Path, jobs: Optional[int] = None) -> List[Dict]:
     """
     Main analysis function. Returns list of security issues.
+
+    Model files are AST-parsed by ``jobs`` worker processes (default: CPU
+    count; 1 parses in-process). With ODOO_SECURITY_CACHE set, results for
+    unchanged files are reused from default_cache_path().
     """
+    cache = ResultCache(default_cache_path()) if RESULT_CACHE else None
+    try:
+        return _check_module(Path(module_path), jobs, cache)
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def _check_module(module_path: Path, jobs: Optional[int],
+                  cache: Optional[ResultCache]) -> List[Dict]:
     issues = []
-    module_path = Path(module_path)
     module_name = module_path.name
 
     # Find models directory
@@ -314,17 +556,44 @@ def check_access_rules(module_path: Path) -> List[Dict]:
         # Try looking in the root (some modules put models at root)
         models_dir = module_path
 
-    # Find all Python files
-    py_files = find_python_files(models_dir)
+    # Find all Python and XML files in one walk of the module
+    py_files, xml_files = scan_module_files(module_path)
     if models_dir == module_path:
         # Filter to only keep model-like files when searching root
         py_files = [f for f in py_files if f.name not in {'__manifest__.py', 'setup.py'}]
+    else:
+        models_prefix = os.path.join(str(models_dir), '')
+        py_files = [f for f in py_files if str(f).startswith(models_prefix)]
+
+    # Extract all model definitions (and company_id fields), reading each
+    # file once and reusing cached results of unchanged files
+    per_file: List[Optional[Tuple[List[Dict], bool]]] = [None] * len(py_files)
+    keys: List[Optional[tuple]] = [None] * len(py_files)
+    if cache is not None:
+        for i, py_file in enumerate(py_files):
+            keys[i] = cache.file_key(py_file)
+            per_file[i] = cache.get('model_file', py_file, keys[i])
+    todo = [i for i, found in enumerate(per_file) if found is None]
+    todo_files = [py_files[i] for i in todo]
+
+    prefetch_files(todo_files)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(todo_files) < PARALLEL_MIN_FILES:
+        extracted = map(scan_model_file, todo_files)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context())
+        extracted = pool.map(scan_model_file, todo_files, chunksize=4)
+    try:
+        for i, scanned in zip(todo, extracted):
+            per_file[i] = scanned
+            if cache is not None:
+                cache.put('model_file', py_files[i], keys[i], scanned)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
-    # Extract all model definitions
-    all_models = []
-    for py_file in py_files:
-        file_models = extract_models_from_file(py_file)
-        all_models.extend(file_models)
+    all_models = [model for file_models, _ in per_file for model in file_models]
 
     if not all_models:
         issues.append({
@@ -347,7 +616,15 @@ def check_access_rules(module_path: Path) -> List[Dict]:
     access_rows = []
     csv_errors = []
     if csv_path:
-        access_rows, csv_errors = parse_access_csv(csv_path)
+        if cache is not None:
+            key = cache.file_key(csv_path)
+            parsed = cache.get('csv', csv_path, key)
+            if parsed is None:
+                parsed = parse_access_csv(csv_path)
+                cache.put('csv', csv_path, key, parsed)
+            access_rows, csv_errors = parsed
+        else:
+            access_rows, csv_errors = parse_access_csv(csv_path)
     else:
         issues.append({
             'severity': 'CRITICAL',
@@ -360,15 +637,21 @@ def check_access_rules(module_path: Path) -> List[Dict]:
             ),
         })
 
-    # Build set of models that have access rules
+    # Build set of models that have access rules, and index the rules by
+    # bare model id
     # model_id format in CSV is either 'model_my_model' or 'module.model_my_model'
     covered_model_ids = set()
+    rules_by_model = defaultdict(list)
     for row in access_rows:
         model_id = row['model_id']
         # Strip module prefix if present
         if '.' in model_id:
-            covered_model_ids.add(model_id.split('.')[-1])
+            bare_model_id = model_id.rsplit('.', 1)[1]
+            covered_model_ids.add(bare_model_id)
+        else:
+            bare_model_id = model_id
         covered_model_ids.add(model_id)
+        rules_by_model[bare_model_id].append(row)
 
     # Report CSV parsing errors
     for error in csv_errors:
@@ -381,16 +664,21 @@ def check_access_rules(module_path: Path) -> List[Dict]:
         })
 
     # Find defined groups
-    defined_groups = find_defined_groups(module_path)
+    defined_groups = find_defined_groups(module_path, xml_files)
 
     # Check each model
     new_models = [m for m in all_models if m.get('name') and not m.get('is_abstract')]
     inherited_only = [m for m in all_models if not m.get('name') and m.get('inherit')]
 
+    csv_rel = str(csv_path.relative_to(module_path)) if csv_path else 'security/ir.model.access.csv'
+    # Model files are reported relative to the module: their paths all
+    # start with this prefix (scan_module_files joins onto module_path)
+    module_prefix = os.path.join(str(module_path), '')
     for model in new_models:
         model_name = model['name']
         expected_csv_id = model_name_to_csv_id(model_name)
-        file_rel = Path(model['file']).relative_to(module_path) if module_path in Path(model['file']).parents else model['file']
+        model_file = model['file']
+        file_rel = model_file[len(module_prefix):] if model_file.startswith(module_prefix) else model_file
 
         # Check if any access rule exists for this model
         has_rule = (
@@ -404,7 +692,7 @@ def check_access_rules(module_path: Path) -> List[Dict]:
             issues.append({
                 'severity': severity,
                 'type': 'missing_access_rule',
-                'file': str(file_rel),
+                'file': file_rel,
                 'line': model['line'],
                 'message': (
                     f"{model_type} '{model_name}' (class {model['class_name']}) "
@@ -413,37 +701,36 @@ def check_access_rules(module_path: Path) -> List[Dict]:
                 ),
             })
         else:
-            # Model has rules — check if they are complete
-            model_rules = [
-                r for r in access_rows
-                if r['model_id'] == expected_csv_id or
-                r['model_id'].endswith('.' + expected_csv_id)
-            ]
-
-            # Check for rules with empty group (grants access to ALL users)
-            for rule in model_rules:
-                if not rule['group_id']:
-                    issues.append({
+            # Model has rules — check if they are complete, in one pass over
+            # its rules; issues are still reported grouped by check
+            empty_group_issues = []
+            permissive_issues = []
+            unknown_group_issues = []
+            for rule in rules_by_model.get(expected_csv_id, ()):
+                group_id = rule['group_id']
+
+                # Check for rules with empty group (grants access to ALL users)
+                if not group_id:
+                    empty_group_issues.append({
                         'severity': 'HIGH',
                         'type': 'empty_group_access',
-                        'file': str(csv_path.relative_to(module_path)) if csv_path else 'security/ir.model.access.csv',
+                        'file': csv_rel,
                         'line': rule['line'],
                         'message': (
                             f"Access rule '{rule['id']}' for model '{model_name}' "
                             f"has no group_id — grants access to ALL authenticated users."
                         ),
                     })
+                    continue
 
-            # Check for suspicious permissions on non-transient models
-            for rule in model_rules:
+                # Check for suspicious permissions on non-transient models
                 if rule['perm_read'] and rule['perm_write'] and rule['perm_unlink']:
-                    group_id = rule.get('group_id', '')
                     # Full CRUD for non-manager groups is suspicious
-                    if group_id and 'manager' not in group_id.lower() and 'admin' not in group_id.lower() and 'system' not in group_id.lower():
-                        issues.append({
+                    if not MANAGER_GROUP_REGEX.search(group_id.lower()):
+                        permissive_issues.append({
                             'severity': 'MEDIUM',
                             'type': 'overly_permissive_access',
-                            'file': str(csv_path.relative_to(module_path)) if csv_path else 'security/ir.model.access.csv',
+                            'file': csv_rel,
                             'line': rule['line'],
                             'message': (
                                 f"Access rule '{rule['id']}' grants full CRUD including DELETE "
@@ -452,16 +739,14 @@ def check_access_rules(module_path: Path) -> List[Dict]:
                             ),
                         })
 
-            # Validate group references exist
-            for rule in model_rules:
-                group_id = rule.get('group_id', '').strip()
-                if group_id and group_id not in defined_groups:
+                # Validate group references exist
+                if group_id not in defined_groups:
                     # Group might be from an external module — warn but don't error
                     if '.' in group_id:
-                        issues.append({
+                        unknown_group_issues.append({
                             'severity': 'LOW',
                             'type': 'unknown_group_reference',
-                            'file': str(csv_path.relative_to(module_path)) if csv_path else 'security/ir.model.access.csv',
+                            'file': csv_rel,
                             'line': rule['line'],
                             'message': (
                                 f"Access rule '{rule['id']}' references group '{group_id}' "
@@ -470,6 +755,10 @@ def check_access_rules(module_path: Path) -> List[Dict]:
                             ),
                         })
 
+            issues.extend(empty_group_issues)
+            issues.extend(permissive_issues)
+            issues.extend(unknown_group_issues)
+
     # Check for models that use _inherit (extension) but add new _name (new model)
     # These are additional models that might be missed
     new_model_names = {m['name'] for m in new_models}
@@ -489,26 +778,21 @@ def check_access_rules(module_path: Path) -> List[Dict]:
     rules_xml_path = module_path / 'security'
     has_rules_xml = any(rules_xml_path.glob('rules_*.xml')) if rules_xml_path.exists() else False
 
-    company_pattern = re.compile(r"company_id\s*=\s*fields\.(Many2one|Integer)\s*\(\s*['\"]res\.company['\"]")
-    for py_file in py_files:
-        try:
-            content = py_file.read_text(encoding='utf-8', errors='replace')
-            if company_pattern.search(content):
-                if not has_rules_xml:
-                    issues.append({
-                        'severity': 'HIGH',
-                        'type': 'missing_record_rule',
-                        'file': str(py_file.relative_to(module_path)),
-                        'line': None,
-                        'message': (
-                            f"File '{py_file.name}' defines a model with company_id field, "
-                            f"but no record rules XML file (security/rules_*.xml) was found. "
-                            f"Multi-company isolation record rules may be missing."
-                        ),
-                    })
-                    break  # Only report once per module
-        except (OSError, IOError):
-            continue
+    if not has_rules_xml:
+        for py_file, (_, has_company_field) in zip(py_files, per_file):
+            if has_company_field:
+                issues.append({
+                    'severity': 'HIGH',
+                    'type': 'missing_record_rule',
+                    'file': str(py_file.relative_to(module_path)),
+                    'line': None,
+                    'message': (
+                        f"File '{py_file.name}' defines a model with company_id field, "
+                        f"but no record rules XML file (security/rules_*.xml) was found. "
+                        f"Multi-company isolation record rules may be missing."
+                    ),
+                })
+                break  # Only report once per module
 
     return issues
 
@@ -554,6 +838,8 @@ def main():
     parser.add_argument('module_path', help='Path to the Odoo module')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', '-j', type=int, default=None, metavar='N',
+                        help='Worker processes for parsing model files (default: CPU count, 1 = no pool)')
 
     args = parser.parse_args()
     module_path = Path(args.module_path).resolve()
@@ -562,7 +848,7 @@ def main():
         print(json.dumps({'error': f'Path not found: {module_path}', 'issues': []}))
         sys.exit(2)
 
-    issues = check_access_rules(module_path)
+    issues = check_access_rules(module_path, jobs=args.jobs)
 
     counts = {s: 0 for s in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']}
     for issue in issues: